@@ -14,25 +14,296 @@ import os
 import sys
 import json
 import time
-import uuid
+import itertools
 import socket
 import struct
+import selectors
 import threading
 import argparse
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Union, Callable, Awaitable, NamedTuple
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s [%(levelname)s] %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# 4 字节大端长度前缀（预编译格式串）
+_U32BE = struct.Struct('>I')
+
+# 默认 ai-agent IPC Socket 路径（导入时解析一次）
+_DEFAULT_SOCKET = os.path.expanduser(
+    "~/Library/Application Support/Trae CN/1.10-main.sock"
+)
+
+# 协议格式探测结果缓存文件
+_PROTOCOL_CACHE_FILE = os.path.expanduser("~/.cache/trae_analyzer/protocol.json")
+
+# Unix socket 收发缓冲区大小
+_SOCKET_BUFFER_SIZE = 1 << 20
+
+# 复用接收缓冲区的初始大小
+_RX_BUFFER_SIZE = 65536
+
+# 每个线程独立的接收缓冲区
+_rx_local = threading.local()
+
+# 单帧最大长度，防止把非长度前缀数据误读为超大帧
+_MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    序列化为 UTF-8 编码的 JSON 字节串
+
+    优先使用 orjson，未安装时回退到标准库 json（保持 ensure_ascii=False 的输出）
+
+    Args:
+        obj: 待序列化对象
+        indent: 是否以 2 空格缩进输出
+
+    Returns:
+        bytes: JSON 字节串
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """反序列化 JSON 字节串（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _Truncated:
+    """
+    日志参数的惰性截断格式化
+
+    只有日志实际输出时才序列化并截断，日志级别被过滤时不产生开销
+    """
+    __slots__ = ('obj', 'limit')
+
+    def __init__(self, obj: Any, limit: int = 200):
+        self.obj = obj
+        self.limit = limit
+
+    def __str__(self) -> str:
+        data = self.obj if isinstance(self.obj, (bytes, bytearray)) else _dumps(self.obj)
+        return data[:self.limit].decode('utf-8', errors='replace')
+
+
+def _encode_length_prefixed(body: bytes) -> bytes:
+    """编码: 4字节长度前缀 + JSON"""
+    return _U32BE.pack(len(body)) + body
+
+
+def _decode_length_prefixed(data: bytes) -> Optional[dict]:
+    """解码: 4字节长度前缀 + JSON"""
+    return _loads(data[4:]) if len(data) >= 4 else None
+
+
+def _encode_newline(body: bytes) -> bytes:
+    """编码: 换行分隔 JSON"""
+    return body + b'\n'
+
+
+def _decode_newline(data: bytes) -> Optional[dict]:
+    """解码: 换行分隔 JSON"""
+    return _loads(data.strip()) if data else None
+
+
+def _encode_raw(body: bytes) -> bytes:
+    """编码: 原始 JSON"""
+    return body
+
+
+def _decode_raw(data: bytes) -> Optional[dict]:
+    """解码: 原始 JSON"""
+    return _loads(data) if data else None
+
+
+def _sendmsg_all(sock: socket.socket, buffers: List[bytes]):
+    """
+    通过 sendmsg 聚集写一次性发送多个缓冲区
+
+    处理部分写入，直到所有数据发送完毕
+
+    Args:
+        sock: 已连接的 socket
+        buffers: 待发送的缓冲区列表
+    """
+    views = [memoryview(buf) for buf in buffers]
+    while views:
+        sent = sock.sendmsg(views)
+        while views and sent >= len(views[0]):
+            sent -= len(views[0])
+            views.pop(0)
+        if sent:
+            views[0] = views[0][sent:]
+
+
+def _recv_into_exact(sock: socket.socket, view: memoryview) -> int:
+    """
+    通过 recv_into 填满 view
+
+    连接提前关闭时只填充部分数据
+
+    Args:
+        sock: 已连接的 socket
+        view: 目标缓冲区视图
+
+    Returns:
+        int: 实际读取的字节数
+    """
+    size = len(view)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if not count:
+            break
+        received += count
+    return received
+
+
+def _rx_buffer(size: int) -> memoryview:
+    """
+    获取当前线程复用的接收缓冲区
+
+    缓冲区按线程隔离，保证多线程调用安全，不足 size 时重新分配
+
+    Args:
+        size: 需要的最小字节数
+
+    Returns:
+        memoryview: 缓冲区视图
+    """
+    buffer = getattr(_rx_local, 'buffer', None)
+    if buffer is None or len(buffer) < size:
+        buffer = bytearray(max(size, _RX_BUFFER_SIZE))
+        _rx_local.buffer = buffer
+    return memoryview(buffer)
+
+
+def _recv_length_prefixed(sock: socket.socket, timeout: float) -> bytes:
+    """
+    接收一帧长度前缀消息（返回包含 4 字节头的完整帧）
+
+    整帧直接接收到复用缓冲区中，只在返回时复制一次
+    """
+    view = _rx_buffer(4)
+    received = _recv_into_exact(sock, view[:4])
+    if received < 4:
+        return bytes(view[:received])
+
+    length = _U32BE.unpack_from(view)[0]
+    if length > _MAX_FRAME_SIZE:
+        raise ValueError(f"帧长度异常: {length}")
+
+    if len(view) < 4 + length:
+        header = bytes(view[:4])
+        view = _rx_buffer(4 + length)
+        view[:4] = header
+
+    received += _recv_into_exact(sock, view[4:4 + length])
+    return bytes(view[:received])
+
+
+def _recv_line(sock: socket.socket, timeout: float) -> bytes:
+    """接收一行换行分隔消息"""
+    buffer = bytearray()
+    chunk = _rx_buffer(4096)[:4096]
+    deadline = time.monotonic() + timeout
 
-@dataclass
-class ProtocolMessage:
+    with selectors.DefaultSelector() as selector:
+        selector.register(sock, selectors.EVENT_READ)
+
+        while True:
+            newline = buffer.find(b'\n')
+            if newline >= 0:
+                return bytes(buffer[:newline + 1])
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not selector.select(remaining):
+                raise socket.timeout("等待换行超时")
+
+            count = sock.recv_into(chunk)
+            if not count:
+                return bytes(buffer)
+
+            buffer += chunk[:count]
+            if len(buffer) > _MAX_FRAME_SIZE:
+                raise ValueError("行长度超出上限")
+
+
+def _recv_raw(sock: socket.socket, timeout: float) -> bytes:
+    """接收原始 JSON（无分帧信息，单次读取）"""
+    view = _rx_buffer(8192)
+    count = sock.recv_into(view[:8192])
+    return bytes(view[:count])
+
+
+async def _read_length_prefixed(reader: asyncio.StreamReader) -> bytes:
+    """异步接收一帧长度前缀消息（返回包含 4 字节头的完整帧）"""
+    try:
+        header = await reader.readexactly(4)
+    except asyncio.IncompleteReadError as e:
+        return e.partial
+
+    length = _U32BE.unpack(header)[0]
+    if length > _MAX_FRAME_SIZE:
+        raise ValueError(f"帧长度异常: {length}")
+
+    try:
+        return header + await reader.readexactly(length)
+    except asyncio.IncompleteReadError as e:
+        return header + e.partial
+
+
+async def _read_line(reader: asyncio.StreamReader) -> bytes:
+    """异步接收一行换行分隔消息"""
+    return await reader.readline()
+
+
+async def _read_raw(reader: asyncio.StreamReader) -> bytes:
+    """异步接收原始 JSON（无分帧信息，单次读取）"""
+    return await reader.read(8192)
+
+
+def _tune_socket(sock):
+    """增大收发缓冲区，减少小帧往返时的唤醒次数（系统上限不足时保持默认）"""
+    for option in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, _SOCKET_BUFFER_SIZE)
+        except OSError as e:
+            logger.debug(f"设置 socket 缓冲区失败: {e}")
+
+
+@dataclass(frozen=True)
+class ProtocolFormat:
+    """协议格式"""
+    __slots__ = ('name', 'encode', 'decode', 'recv', 'read')
+    name: str
+    encode: Callable[[bytes], bytes]
+    decode: Callable[[bytes], Optional[dict]]
+    recv: Callable[[socket.socket, float], bytes]
+    read: Callable[[asyncio.StreamReader], Awaitable[bytes]]
+
+
+class ProtocolMessage(NamedTuple):
     """协议消息"""
     raw: bytes = None
     parsed: dict = None
@@ -74,26 +345,60 @@ class AiAgentProtocolAnalyzer:
         ]
     }
     
-    # 可能的协议格式
+    # Chat / Agent 服务测试用例: (service, method, params)
+    CHAT_AGENT_PROBES = [
+        ("chat", "get_sessions", {}),
+        ("chat", "get_sessions", {"limit": 10}),
+        ("agent", "get_solo_qualification", {}),
+        ("agent", "get_agent_status", {}),
+    ]
+    
+    # VSCode IPC 探测消息，使用 4 字节长度前缀 + JSON-RPC 风格消息
+    # 消息格式: [type, id, channel, method, arg]
+    # 帧在类定义时预先编码: (name, message, frame)
+    _IPC_PROBE_FRAMES = [
+        (name, msg, _encode_length_prefixed(_dumps(msg)))
+        for name, msg in (
+            # 简单 ping
+            ("Ping", [0, 1, "", "ping", []]),
+            # 获取配置
+            ("get_user_configuration", [100, 2, "configuration", "get_user_configuration", []]),
+            # Chat 会话
+            ("chat.get_sessions", [102, 3, "chat", "get_sessions", []]),
+            # Agent Solo
+            ("agent.get_solo_qualification", [100, 4, "agent", "get_solo_qualification", []]),
+        )
+    ]
+    
+    # 服务发现阶段的并发连接数
+    DISCOVERY_WORKERS = 8
+    
+    # 可能的协议格式（encode 接收已序列化的 JSON 字节串）
     PROTOCOL_FORMATS = [
         # 格式1: 4字节长度前缀 + JSON
-        {
-            "name": "length_prefixed_json",
-            "encode": lambda msg: struct.pack('>I', len(msg)) + msg.encode('utf-8'),
-            "decode": lambda data: json.loads(data[4:].decode('utf-8')) if len(data) >= 4 else None
-        },
+        ProtocolFormat(
+            name="length_prefixed_json",
+            encode=_encode_length_prefixed,
+            decode=_decode_length_prefixed,
+            recv=_recv_length_prefixed,
+            read=_read_length_prefixed
+        ),
         # 格式2: 简单换行分隔
-        {
-            "name": "newline_delimited",
-            "encode": lambda msg: (msg + '\n').encode('utf-8'),
-            "decode": lambda data: json.loads(data.decode('utf-8').strip()) if data else None
-        },
+        ProtocolFormat(
+            name="newline_delimited",
+            encode=_encode_newline,
+            decode=_decode_newline,
+            recv=_recv_line,
+            read=_read_line
+        ),
         # 格式3: 原始 JSON
-        {
-            "name": "raw_json",
-            "encode": lambda msg: msg.encode('utf-8'),
-            "decode": lambda data: json.loads(data.decode('utf-8')) if data else None
-        }
+        ProtocolFormat(
+            name="raw_json",
+            encode=_encode_raw,
+            decode=_decode_raw,
+            recv=_recv_raw,
+            read=_read_raw
+        )
     ]
     
     def __init__(self, socket_path: str = None):
@@ -104,15 +409,25 @@ class AiAgentProtocolAnalyzer:
             socket_path: Unix Domain Socket 路径
         """
         if socket_path is None:
-            socket_path = os.path.expanduser(
-                "~/Library/Application Support/Trae CN/1.10-main.sock"
-            )
+            socket_path = _DEFAULT_SOCKET
         
         self.socket_path = socket_path
         self.socket: Optional[socket.socket] = None
+        # 主连接当前的超时设置，仅在变化时调用 settimeout
+        self._current_timeout: Optional[float] = None
         self.connected = False
         self.message_history: List[ProtocolMessage] = []
         
+        # (service, method) -> 预序列化的请求 JSON 前缀
+        self._frame_cache: Dict[Tuple[str, str], bytes] = {}
+        
+        # 请求 ID 计数器（仅用于同一分析会话内的请求关联）
+        self._next_id = itertools.count(1)
+        # 预建请求模板，copy 后按固定键顺序填充字段
+        self._req_template: Dict[str, Any] = dict.fromkeys(
+            ("service", "method", "params", "request_id", "timestamp")
+        )
+        
     def connect(self, timeout: float = 5.0) -> bool:
         """
         连接到 ai-agent IPC Socket
@@ -121,21 +436,20 @@ class AiAgentProtocolAnalyzer:
             bool: 是否连接成功
         """
         try:
-            if not os.path.exists(self.socket_path):
-                logger.error(f"❌ Socket 不存在: {self.socket_path}")
-                return False
-            
             logger.info(f"🔌 尝试连接到: {self.socket_path}")
             
-            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            self.socket.settimeout(timeout)
-            self.socket.connect(self.socket_path)
+            # 直接连接，由 FileNotFoundError 判断 socket 是否存在
+            self.socket = self._open_socket(timeout)
+            self._current_timeout = timeout
             
             self.connected = True
             logger.info(f"✅ 连接成功!")
             
             return True
             
+        except FileNotFoundError:
+            logger.error(f"❌ Socket 不存在: {self.socket_path}")
+            return False
         except socket.timeout:
             logger.error("❌ 连接超时")
             return False
@@ -143,25 +457,99 @@ class AiAgentProtocolAnalyzer:
             logger.error(f"❌ 连接失败: {e}")
             return False
     
+    def _open_socket(self, timeout: float) -> socket.socket:
+        """
+        新建一条到 ai-agent 的连接
+        
+        Args:
+            timeout: 连接超时时间
+            
+        Returns:
+            socket.socket: 已连接的 socket
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(self.socket_path)
+        except Exception:
+            sock.close()
+            raise
+        
+        _tune_socket(sock)
+        return sock
+    
     def disconnect(self):
         """断开连接"""
         if self.socket:
             self.socket.close()
             self.socket = None
+            self._current_timeout = None
             self.connected = False
             logger.info("已断开连接")
     
+    def _set_timeout(self, timeout: float):
+        """
+        设置主连接超时（与当前值相同时跳过系统调用）
+        
+        Args:
+            timeout: 超时时间
+        """
+        if timeout != self._current_timeout:
+            self.socket.settimeout(timeout)
+            self._current_timeout = timeout
+    
+    def _encode_request(self, service: str, method: str, params: dict = None) -> bytes:
+        """
+        序列化服务调用请求
+        
+        无参数请求的 JSON 前缀按 (service, method) 缓存，
+        每次只拼接 request_id 和 timestamp；带参数请求复制预建模板后填充
+        
+        Args:
+            service: 服务名
+            method: 方法名
+            params: 参数
+            
+        Returns:
+            bytes: 请求 JSON 字节串
+        """
+        if params:
+            request = self._req_template.copy()
+            request["service"] = service
+            request["method"] = method
+            request["params"] = params
+            request["request_id"] = f"req-{next(self._next_id)}"
+            request["timestamp"] = time.monotonic_ns()
+            return _dumps(request)
+        
+        prefix = self._frame_cache.get((service, method))
+        if prefix is None:
+            prefix = _dumps({
+                "service": service,
+                "method": method,
+                "params": {}
+            })[:-1] + b',"request_id":"'
+            self._frame_cache[(service, method)] = prefix
+        
+        return b''.join((
+            prefix,
+            f"req-{next(self._next_id)}".encode('ascii'),
+            b'","timestamp":',
+            str(time.monotonic_ns()).encode('ascii'),
+            b'}'
+        ))
+    
     def send_and_receive(
         self, 
-        message: dict, 
-        protocol_format: dict,
+        message: Union[dict, bytes], 
+        protocol_format: ProtocolFormat,
         timeout: float = 3.0
     ) -> Optional[dict]:
         """
         发送消息并接收响应
         
         Args:
-            message: 发送的消息
+            message: 发送的消息（dict 或已序列化的 JSON 字节串）
             protocol_format: 协议格式
             timeout: 超时时间
             
@@ -172,35 +560,41 @@ class AiAgentProtocolAnalyzer:
             logger.error("未连接")
             return None
         
+        self._set_timeout(timeout)
+        return self._exchange(self.socket, message, protocol_format, timeout)
+    
+    def _exchange(
+        self,
+        sock: socket.socket,
+        message: Union[dict, bytes],
+        protocol_format: ProtocolFormat,
+        timeout: float
+    ) -> Optional[dict]:
+        """
+        在指定连接上完成一次请求-响应
+        
+        Args:
+            sock: 已连接且已设置超时的 socket
+            message: 发送的消息（dict 或已序列化的 JSON 字节串）
+            protocol_format: 协议格式
+            timeout: 超时时间
+            
+        Returns:
+            Optional[dict]: 响应消息
+        """
         try:
             # 序列化消息
-            content = json.dumps(message, ensure_ascii=False)
-            encoded = protocol_format["encode"](content)
+            content = message if isinstance(message, bytes) else _dumps(message)
+            encoded = protocol_format.encode(content)
             
             # 发送
-            self.socket.sendall(encoded)
-            logger.debug(f"📤 发送: {content[:100]}...")
-            
-            # 接收
-            self.socket.settimeout(timeout)
-            response = self.socket.recv(8192)
-            
-            if not response:
-                logger.warning("空响应")
-                return None
+            sock.sendall(encoded)
+            logger.debug("📤 发送: %s...", _Truncated(content, 100))
             
-            # 解析响应
-            parsed = protocol_format["decode"](response)
+            # 按协议格式分帧接收
+            response = protocol_format.recv(sock, timeout)
             
-            if parsed:
-                logger.debug(f"📥 收到: {str(parsed)[:100]}...")
-                self.message_history.append(ProtocolMessage(
-                    raw=response,
-                    parsed=parsed,
-                    timestamp=time.time()
-                ))
-            
-            return parsed
+            return self._record_response(response, protocol_format)
             
         except socket.timeout:
             logger.warning("响应超时")
@@ -208,45 +602,237 @@ class AiAgentProtocolAnalyzer:
         except json.JSONDecodeError as e:
             logger.warning(f"JSON 解析失败: {e}")
             return None
+        except ValueError as e:
+            logger.warning(f"分帧失败: {e}")
+            return None
         except Exception as e:
             logger.error(f"通信错误: {e}")
             return None
     
-    def test_protocol_format(self) -> Optional[dict]:
+    def _record_response(
+        self,
+        response: bytes,
+        protocol_format: ProtocolFormat
+    ) -> Optional[dict]:
+        """
+        解析响应并记录到消息历史
+        
+        Args:
+            response: 接收到的原始数据
+            protocol_format: 协议格式
+            
+        Returns:
+            Optional[dict]: 解析后的响应消息
+        """
+        if not response:
+            logger.warning("空响应")
+            return None
+        
+        parsed = protocol_format.decode(response)
+        
+        if parsed:
+            logger.debug("📥 收到: %s...", _Truncated(parsed, 100))
+            self.message_history.append(ProtocolMessage(
+                raw=response,
+                parsed=parsed,
+                timestamp=time.time()
+            ))
+        
+        return parsed
+    
+    def test_protocol_format(self) -> Optional[ProtocolFormat]:
         """
         测试不同的协议格式
         
         Returns:
-            Optional[dict]: 可用的协议格式
+            Optional[ProtocolFormat]: 可用的协议格式
         """
         logger.info("\n" + "="*60)
         logger.info("测试协议格式")
         logger.info("="*60)
         
+        cached, cached_format = self._lookup_cached_format()
+        if cached:
+            if cached_format:
+                logger.info(f"📦 使用缓存的协议格式: {cached_format.name}")
+            else:
+                logger.error("❌ 没有可用的协议格式（缓存）")
+            return cached_format
+        
+        # 握手消息只序列化一次，各格式复用
+        handshake = _dumps({
+            "type": "handshake",
+            "client": "python_analyzer",
+            "version": "1.0",
+            "timestamp": time.monotonic_ns()
+        })
+        
         for fmt in self.PROTOCOL_FORMATS:
-            logger.info(f"\n测试格式: {fmt['name']}")
-            
-            # 发送握手消息
-            handshake = {
-                "type": "handshake",
-                "client": "python_analyzer",
-                "version": "1.0",
-                "timestamp": time.time()
-            }
+            logger.info(f"\n测试格式: {fmt.name}")
             
             response = self.send_and_receive(handshake, fmt, timeout=2.0)
             
             if response:
-                logger.info(f"✅ 格式 {fmt['name']} 可用!")
+                logger.info(f"✅ 格式 {fmt.name} 可用!")
+                self._store_cached_format(fmt)
                 return fmt
         
         logger.error("❌ 没有可用的协议格式")
+        self._store_cached_format(None)
         return None
     
-    def discover_services(self, protocol_format: dict):
+    def _lookup_cached_format(self) -> Tuple[bool, Optional[ProtocolFormat]]:
+        """
+        查询协议格式缓存
+        
+        缓存以 socket 路径为键，并校验 socket 文件的 mtime（Trae CN 重启后失效）。
+        探测失败的结果同样会被缓存。
+        
+        Returns:
+            Tuple[bool, Optional[ProtocolFormat]]: (是否命中, 缓存的协议格式)
+        """
+        try:
+            mtime = os.stat(self.socket_path).st_mtime
+            with open(_PROTOCOL_CACHE_FILE, 'rb') as f:
+                entry = _loads(f.read()).get(self.socket_path)
+        except (OSError, ValueError, AttributeError):
+            return False, None
+        
+        if not isinstance(entry, dict) or entry.get("mtime") != mtime:
+            return False, None
+        
+        name = entry.get("format")
+        if name is None:
+            return True, None
+        
+        for fmt in self.PROTOCOL_FORMATS:
+            if fmt.name == name:
+                return True, fmt
+        
+        return False, None
+    
+    def _store_cached_format(self, protocol_format: Optional[ProtocolFormat]):
+        """
+        写入协议格式缓存
+        
+        Args:
+            protocol_format: 探测到的协议格式，None 表示没有可用格式
+        """
+        try:
+            mtime = os.stat(self.socket_path).st_mtime
+            
+            try:
+                with open(_PROTOCOL_CACHE_FILE, 'rb') as f:
+                    cache = _loads(f.read())
+                if not isinstance(cache, dict):
+                    cache = {}
+            except (OSError, ValueError):
+                cache = {}
+            
+            cache[self.socket_path] = {
+                "mtime": mtime,
+                "format": protocol_format.name if protocol_format else None
+            }
+            
+            os.makedirs(os.path.dirname(_PROTOCOL_CACHE_FILE), exist_ok=True)
+            with open(_PROTOCOL_CACHE_FILE, 'wb') as f:
+                f.write(_dumps(cache, indent=True))
+                
+        except OSError as e:
+            logger.debug(f"写入协议格式缓存失败: {e}")
+    
+    async def _probe(
+        self,
+        service: str,
+        method: str,
+        protocol_format: ProtocolFormat,
+        semaphore: asyncio.Semaphore,
+        timeout: float = 2.0
+    ) -> Optional[dict]:
+        """
+        使用独立连接异步探测单个服务方法
+        
+        Args:
+            service: 服务名
+            method: 方法名
+            protocol_format: 协议格式
+            semaphore: 限制并发连接数的信号量
+            timeout: 超时时间
+            
+        Returns:
+            Optional[dict]: 响应消息
+        """
+        async with semaphore:
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_unix_connection(self.socket_path, limit=_MAX_FRAME_SIZE),
+                    timeout
+                )
+            except Exception as e:
+                logger.warning(f"  ⚠️  {service}.{method}: 连接失败 {e}")
+                return None
+            
+            try:
+                _tune_socket(writer.get_extra_info('socket'))
+                
+                writer.write(protocol_format.encode(self._encode_request(service, method)))
+                await writer.drain()
+                
+                response = await asyncio.wait_for(protocol_format.read(reader), timeout)
+                return self._record_response(response, protocol_format)
+                
+            except asyncio.TimeoutError:
+                logger.warning("响应超时")
+                return None
+            except json.JSONDecodeError as e:
+                logger.warning(f"JSON 解析失败: {e}")
+                return None
+            except ValueError as e:
+                logger.warning(f"分帧失败: {e}")
+                return None
+            except Exception as e:
+                logger.error(f"通信错误: {e}")
+                return None
+            finally:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except Exception:
+                    pass
+    
+    async def _discover_all(
+        self,
+        protocol_format: ProtocolFormat
+    ) -> Dict[Tuple[str, str], Optional[dict]]:
+        """
+        在单个事件循环中并发探测所有已知服务方法
+        
+        Args:
+            protocol_format: 协议格式
+            
+        Returns:
+            Dict[Tuple[str, str], Optional[dict]]: (service, method) -> 响应消息
+        """
+        semaphore = asyncio.Semaphore(self.DISCOVERY_WORKERS)
+        combos = [
+            (service, method)
+            for service, methods in self.KNOWN_SERVICES.items()
+            for method in methods
+        ]
+        
+        responses = await asyncio.gather(*(
+            self._probe(service, method, protocol_format, semaphore)
+            for service, method in combos
+        ))
+        
+        return dict(zip(combos, responses))
+    
+    def discover_services(self, protocol_format: ProtocolFormat):
         """
         发现可用的服务和方法
         
+        各方法的探测互不依赖，在 asyncio 事件循环中并发执行，每个探测使用独立连接
+        
         Args:
             protocol_format: 协议格式
         """
@@ -254,27 +840,21 @@ class AiAgentProtocolAnalyzer:
         logger.info("发现服务和方法")
         logger.info("="*60)
         
+        results = asyncio.run(self._discover_all(protocol_format))
+        
         for service, methods in self.KNOWN_SERVICES.items():
             logger.info(f"\n服务: {service}")
             
             for method in methods:
-                request = {
-                    "service": service,
-                    "method": method,
-                    "params": {},
-                    "request_id": str(uuid.uuid4()),
-                    "timestamp": time.time()
-                }
-                
-                response = self.send_and_receive(request, protocol_format, timeout=2.0)
+                response = results[(service, method)]
                 
                 if response:
                     logger.info(f"  ✅ {method}: 可用")
-                    logger.debug(f"     响应: {response}")
+                    logger.debug("     响应: %s", response)
                 else:
                     logger.warning(f"  ⚠️  {method}: 无响应")
     
-    def test_chat_and_agent_services(self, protocol_format: dict):
+    def test_chat_and_agent_services(self, protocol_format: ProtocolFormat):
         """
         测试 chat 和 agent 服务（Solo 功能相关）
         
@@ -285,55 +865,26 @@ class AiAgentProtocolAnalyzer:
         logger.info("测试 Chat 和 Agent 服务")
         logger.info("="*60)
         
-        # 测试 Chat 服务
-        logger.info("\n💬 Chat 服务:")
-        
-        chat_requests = [
-            {"method": "get_sessions", "params": {}},
-            {"method": "get_sessions", "params": {"limit": 10}},
-        ]
+        headings = {
+            "chat": "\n💬 Chat 服务:",
+            "agent": "\n🤖 Agent 服务:",
+        }
+        current_service = None
         
-        for req in chat_requests:
-            request = {
-                "service": "chat",
-                "method": req["method"],
-                "params": req["params"],
-                "request_id": str(uuid.uuid4()),
-                "timestamp": time.time()
-            }
-            
-            response = self.send_and_receive(request, protocol_format, timeout=3.0)
+        for service, method, params in self.CHAT_AGENT_PROBES:
+            if service != current_service:
+                current_service = service
+                logger.info(headings[service])
             
-            if response:
-                logger.info(f"  ✅ get_sessions: 成功")
-                logger.info(f"     数据: {json.dumps(response, indent=2, ensure_ascii=False)[:200]}")
-            else:
-                logger.warning(f"  ⚠️  get_sessions: 无响应")
-        
-        # 测试 Agent 服务
-        logger.info("\n🤖 Agent 服务:")
-        
-        agent_requests = [
-            {"method": "get_solo_qualification", "params": {}},
-            {"method": "get_agent_status", "params": {}},
-        ]
-        
-        for req in agent_requests:
-            request = {
-                "service": "agent",
-                "method": req["method"],
-                "params": req["params"],
-                "request_id": str(uuid.uuid4()),
-                "timestamp": time.time()
-            }
+            request = self._encode_request(service, method, params)
             
             response = self.send_and_receive(request, protocol_format, timeout=3.0)
             
             if response:
-                logger.info(f"  ✅ {req['method']}: 成功")
-                logger.info(f"     数据: {json.dumps(response, indent=2, ensure_ascii=False)[:200]}")
+                logger.info(f"  ✅ {method}: 成功")
+                logger.info("     数据: %s", _Truncated(response))
             else:
-                logger.warning(f"  ⚠️  {req['method']}: 无响应")
+                logger.warning(f"  ⚠️  {method}: 无响应")
     
     def test_ipc_message_format(self):
         """
@@ -343,39 +894,31 @@ class AiAgentProtocolAnalyzer:
         logger.info("测试 VSCode IPC 消息格式")
         logger.info("="*60)
         
-        # VSCode 使用 4 字节长度前缀 + JSON-RPC 风格消息
-        # 消息格式: [type, id, channel, method, arg]
+        # 所有帧一次性聚集写发送，再按顺序逐帧读取响应
+        try:
+            _sendmsg_all(self.socket, [frame for _, _, frame in self._IPC_PROBE_FRAMES])
+        except Exception as e:
+            logger.error(f"❌ 发送失败: {e}")
+            return
+        
+        for name, msg, _ in self._IPC_PROBE_FRAMES:
+            logger.info(f"📤 发送 {name}: {msg}")
         
-        test_messages = [
-            # 简单 ping
-            ([0, 1, "", "ping", []], "Ping"),
-            # 获取配置
-            ([100, 2, "configuration", "get_user_configuration", []], "get_user_configuration"),
-            # Chat 会话
-            ([102, 3, "chat", "get_sessions", []], "chat.get_sessions"),
-            # Agent Solo
-            ([100, 4, "agent", "get_solo_qualification", []], "agent.get_solo_qualification"),
-        ]
+        self._set_timeout(2.0)
         
-        for msg, name in test_messages:
+        for name, _, _ in self._IPC_PROBE_FRAMES:
             try:
-                # 序列化
-                content = json.dumps(msg)
-                encoded = struct.pack('>I', len(content)) + content.encode('utf-8')
-                
-                # 发送
-                self.socket.sendall(encoded)
-                logger.info(f"📤 发送 {name}: {msg}")
-                
-                # 接收
-                self.socket.settimeout(2.0)
-                response = self.socket.recv(8192)
+                response = _recv_length_prefixed(self.socket, 2.0)
                 
                 if response:
                     logger.info(f"📥 响应 {name}: {response[:200]}")
                 else:
                     logger.warning(f"⚠️  {name}: 空响应")
                     
+            except socket.timeout:
+                # 响应按发送顺序返回，前一帧超时则不再等待后续响应
+                logger.warning(f"⚠️  {name}: 响应超时")
+                break
             except Exception as e:
                 logger.error(f"❌ {name}: {e}")
     
@@ -421,14 +964,17 @@ class AiAgentProtocolAnalyzer:
         output_file = "/Volumes/600g/app1/env-fix/trae_asar/message_history.json"
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump([
-                    {
+            # 逐条序列化写入，避免先构建完整列表
+            with open(output_file, 'wb') as f:
+                f.write(b'[\n')
+                for index, msg in enumerate(self.message_history):
+                    if index:
+                        f.write(b',\n')
+                    f.write(_dumps({
                         "timestamp": msg.timestamp,
                         "parsed": msg.parsed
-                    }
-                    for msg in self.message_history
-                ], f, indent=2, ensure_ascii=False)
+                    }, indent=True))
+                f.write(b'\n]\n')
             
             logger.info(f"\n💾 消息历史已保存到: {output_file}")
             
@@ -445,9 +991,7 @@ class SimpleIPCTester:
     
     def __init__(self, socket_path: str = None):
         if socket_path is None:
-            socket_path = os.path.expanduser(
-                "~/Library/Application Support/Trae CN/1.10-main.sock"
-            )
+            socket_path = _DEFAULT_SOCKET
         self.socket_path = socket_path
     
     def test_connection(self):
@@ -456,14 +1000,15 @@ class SimpleIPCTester:
         print("IPC 连接测试")
         print("="*60)
         
-        if not os.path.exists(self.socket_path):
-            print(f"❌ Socket 不存在: {self.socket_path}")
-            return
-        
         try:
             sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             sock.settimeout(3.0)
-            sock.connect(self.socket_path)
+            try:
+                sock.connect(self.socket_path)
+            except FileNotFoundError:
+                sock.close()
+                print(f"❌ Socket 不存在: {self.socket_path}")
+                return
             
             print(f"✅ 连接成功!")
             
@@ -472,7 +1017,7 @@ class SimpleIPCTester:
                 {
                     "name": "VSCode IPC (长度前缀)",
                     "data": json.dumps([100, 1, "agent", "get_solo_qualification", []]),
-                    "encoded": lambda d: struct.pack('>I', len(d)) + d.encode('utf-8')
+                    "encoded": _encode_length_prefixed
                 },
                 {
                     "name": "JSON-RPC 风格",
@@ -482,7 +1027,7 @@ class SimpleIPCTester:
                         "method": "agent/get_solo_qualification",
                         "params": {}
                     }),
-                    "encoded": lambda d: d.encode('utf-8')
+                    "encoded": _encode_raw
                 },
                 {
                     "name": "简单对象",
@@ -490,14 +1035,14 @@ class SimpleIPCTester:
                         "service": "agent",
                         "method": "get_solo_qualification"
                     }),
-                    "encoded": lambda d: d.encode('utf-8')
+                    "encoded": _encode_raw
                 }
             ]
             
             for tc in test_cases:
                 print(f"\n测试: {tc['name']}")
                 try:
-                    encoded = tc["encoded"](tc["data"])
+                    encoded = tc["encoded"](tc["data"].encode('utf-8'))
                     print(f"  发送: {tc['data'][:100]}...")
                     sock.sendall(encoded)
                     
@@ -543,9 +1088,7 @@ def main():
     
     socket_path = args.socket
     if socket_path is None:
-        socket_path = os.path.expanduser(
-            "~/Library/Application Support/Trae CN/1.10-main.sock"
-        )
+        socket_path = _DEFAULT_SOCKET
     
     if args.simple:
         tester = SimpleIPCTester(socket_path)
@@ -1,102 +1,11 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Trae CN 逆向工程分析报告
-
-基于日志逆向分析和实际测试的结果
-
-## 已发现的协议信息
-
-### 1. REST API 端点
-
-**基础 URL**: https://api.trae.com.cn
-
-**已发现的端点**:
-- `/cloudide/api/v3/trae/GetUserInfo` - 获取用户信息
-- `/trae/api/v1/trae_solo_qualification` - 获取 Solo 资格
-- `/icube/api/v1/native/config/query` - 获取原生配置
-
-**认证**: 需要 Bearer Token（从 storage.json 提取）
-
-**当前状态**: 
-- Token 提取成功 ✅
-- 但 API 返回 401 ❌ (Token 可能过期或格式不正确)
-
-### 2. IPC Socket 通信
-
-**Socket 路径**: ~/Library/Application Support/Trae CN/1.10-main.sock
-
-**协议**: TowelTransport (基于 ai-agent 日志逆向)
-
-**发现的服务**:
-- `ckg`: setup, refresh_token, is_ckg_enabled_for_non_workspace_scenario
-- `project`: create_project, get_project_info
-- `configuration`: get_user_configuration, get_user_info
-- `chat`: get_sessions, send_message, create_session, delete_session
-- `agent`: get_solo_qualification, get_agent_status, execute_command
-
-**当前状态**:
-- Socket 连接成功 ✅
-- 但所有请求格式测试失败 ❌ (协议格式未知)
-
-### 3. 测试过的协议格式
-
-1. **VSCode IPC 格式**
-   - 格式: [type, id, channel, method, arg] + 4字节长度前缀
-   - 结果: 连接成功，请求超时 ❌
-
-2. **JSON-RPC 2.0 格式**
-   - 格式: {"jsonrpc": "2.0", "id": 1, "method": "...", "params": {...}}
-   - 结果: 连接成功，请求超时 ❌
-
-3. **TowelTransport 格式**
-   - 格式: {"service": "...", "method": "...", "params": {...}}
-   - 结果: 连接成功，请求超时 ❌
-
-## 建议的后续步骤
-
-1. **网络抓包分析**
-   - 使用 Wireshark 或 mitmproxy 抓取实际的网络请求
-   - 观察 API 请求的正确格式和认证方式
-
-2. **更新 Token**
-   - 当前的 Token 可能已过期
-   - 需要重新登录获取新的 Token
-
-3. **继续逆向 IPC 协议**
-   - 需要查看更多 ai-agent 的源代码
-   - 尝试在 Trae CN 运行时抓取原始数据
-
-4. **检查其他 API 地址**
-   - 可能的地址:
-     - https://trae.cn/api/...
-     - https://icube.cn/api/...
-     - https://cloudide.cn/api/...
-
-## 已创建的文件
-
-- `trae_client.py` - 完整客户端实现
-- `ai_agent_analyzer.py` - IPC 协议分析器
-- `towel_transport.py` - TowelTransport 协议实现
-
-## 使用方法
-
-```bash
-# 测试 REST API
-python3 trae_client.py
-
-# 测试 IPC 连接
-python3 trae_client.py --ipc
-
-# 运行协议分析器
-python3 ai_agent_analyzer.py
-```
+生成 Trae CN 逆向工程分析报告（ANALYSIS_REPORT.md）
 """
 
-import json
-import os
-
-report = """
+# 报告正文（唯一来源）
+REPORT = """
 # Trae CN 逆向工程分析报告
 
 ## 已发现的协议信息
@@ -190,6 +99,6 @@ python3 ai_agent_analyzer.py
 # 保存报告
 report_path = "/Volumes/600g/app1/env-fix/trae_asar/ANALYSIS_REPORT.md"
 with open(report_path, 'w', encoding='utf-8') as f:
-    f.write(report)
+    f.write(REPORT)
 
 print(f"✅ 分析报告已保存到: {report_path}")
@@ -33,18 +33,224 @@ ipc.close()
 import os
 import json
 import time
+import asyncio
+import functools
+import itertools
 import socket
+import selectors
 import threading
 import logging
-from typing import Optional, Callable, Dict, Any
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
+
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 消息行结束符（换行分隔的 JSON 消息）
+_LINE_END = b'\n'
+
+# 自动检测到的 socket 路径缓存: (检测时间, 路径)，在有效期内直接复用
+_SOCKET_PATH_CACHE: Optional[Tuple[float, str]] = None
+_SOCKET_PATH_TTL = 5.0
+
+# 默认的 socket 收发缓冲区大小
+_DEFAULT_SOCKET_BUFFER = 4 * 1024 * 1024
+
+# SOCK_SEQPACKET 模式下单条消息的最大长度（每次 recv 读取一条完整消息）
+_SEQPACKET_MAX_MESSAGE = 1 << 20
+
+# 异步通信器 StreamReader 的缓冲上限及单次读取的最大字节数
+_ASYNC_STREAM_LIMIT = 16 * 1024 * 1024
+_ASYNC_READ_SIZE = 256 * 1024
+
+# 标准库回退时复用的 JSON 编码器（紧凑输出，保留非 ASCII 字符）
+_json_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    序列化为 UTF-8 编码的 JSON 字节串
+
+    优先使用 orjson，未安装时回退到标准库 json
+
+    Args:
+        obj: 待序列化对象
+
+    Returns:
+        bytes: JSON 字节串
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return _json_encoder.encode(obj).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """反序列化 JSON 字节串（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=64)
+def _request_envelope(method: str) -> bytes:
+    """
+    请求信封中 id 之后、params 之前的固定部分（按方法名缓存）
+
+    Args:
+        method: 方法名
+
+    Returns:
+        bytes: '","type":"request","method":<method>,"params":'
+    """
+    return b'","type":"request","method":' + _dumps(method) + b',"params":'
+
+
+@functools.lru_cache(maxsize=64)
+def _notification_envelope(method: str) -> bytes:
+    """
+    通知信封中 params 之前的固定部分（按方法名缓存）
+
+    Args:
+        method: 方法名
+
+    Returns:
+        bytes: '{"type":"notification","method":<method>,"params":'
+    """
+    return b'{"type":"notification","method":' + _dumps(method) + b',"params":'
+
+
+def _encode_request(req_id: str, method: str, params: Optional[dict]) -> List[bytes]:
+    """
+    编码一行请求消息
+
+    信封按方法名预先编码，运行时只序列化参数；返回的分段可直接聚集写发送
+
+    Args:
+        req_id: 请求 ID（纯数字字符串）
+        method: 方法名
+        params: 参数
+
+    Returns:
+        List[bytes]: 依次拼接即为 {"id","type","method","params"} 的 JSON 行
+    """
+    return [
+        b'{"id":"',
+        req_id.encode('ascii'),
+        _request_envelope(method),
+        _dumps(params or {}),
+        b'}' + _LINE_END
+    ]
+
+
+def _encode_notification(method: str, params: Optional[dict]) -> List[bytes]:
+    """
+    编码一行通知消息
+
+    Args:
+        method: 方法名
+        params: 参数
+
+    Returns:
+        List[bytes]: 依次拼接即为 {"type","method","params"} 的 JSON 行
+    """
+    return [
+        _notification_envelope(method),
+        _dumps(params or {}),
+        b'}' + _LINE_END
+    ]
+
+
+def _tune_socket(sock: socket.socket, rcvbuf: int, sndbuf: int):
+    """
+    设置 socket 收发缓冲区大小
+
+    Unix Socket 默认缓冲区较小，大消息需要多次往返读取；
+    系统上限不足时保持默认值
+
+    Args:
+        sock: socket 对象
+        rcvbuf: 接收缓冲区大小（字节）
+        sndbuf: 发送缓冲区大小（字节）
+    """
+    for option, size in ((socket.SO_RCVBUF, rcvbuf), (socket.SO_SNDBUF, sndbuf)):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, size)
+        except OSError as e:
+            logger.debug(f"设置 socket 缓冲区失败: {e}")
+
+
+def _sendmsg_all(sock: socket.socket, buffers: List[bytes]):
+    """
+    通过 sendmsg 聚集写一次性发送多个缓冲区
+
+    处理部分写入，直到所有数据发送完毕
+
+    Args:
+        sock: 已连接的 socket
+        buffers: 待发送的缓冲区列表
+    """
+    views = [memoryview(buf) for buf in buffers]
+    while views:
+        sent = sock.sendmsg(views)
+        while views and sent >= len(views[0]):
+            sent -= len(views[0])
+            views.pop(0)
+        if sent:
+            views[0] = views[0][sent:]
+
+
+def _detect_socket_path() -> str:
+    """
+    自动检测 Trae CN 的 socket 路径
+
+    检测结果在模块级缓存 _SOCKET_PATH_TTL 秒，重复创建实例时不再扫描目录
+
+    Returns:
+        socket 路径
+    """
+    global _SOCKET_PATH_CACHE
+
+    now = time.monotonic()
+    if _SOCKET_PATH_CACHE and now - _SOCKET_PATH_CACHE[0] < _SOCKET_PATH_TTL:
+        return _SOCKET_PATH_CACHE[1]
+
+    base_path = os.path.expanduser(
+        "~/Library/Application Support/Trae CN"
+    )
+
+    # 单次扫描目录，查找最新的 socket 文件
+    latest_path = None
+    latest_mtime = -1.0
+    try:
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.sock'):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if mtime > latest_mtime:
+                    latest_path, latest_mtime = entry.path, mtime
+    except OSError:
+        pass
+
+    # 默认路径
+    if latest_path is None:
+        latest_path = os.path.join(base_path, "1.10-main.sock")
+
+    _SOCKET_PATH_CACHE = (now, latest_path)
+    return latest_path
+
 
 class MessageType(Enum):
     """消息类型枚举"""
@@ -75,7 +281,10 @@ class IPCCommunicator:
         self,
         socket_path: str = None,
         auto_connect: bool = True,
-        timeout: int = 30
+        timeout: int = 30,
+        use_seqpacket: bool = False,
+        rcvbuf: int = _DEFAULT_SOCKET_BUFFER,
+        sndbuf: int = _DEFAULT_SOCKET_BUFFER
     ):
         """
         初始化 IPC 通信器
@@ -84,6 +293,9 @@ class IPCCommunicator:
             socket_path: Unix Socket 路径，如果为 None 则自动检测
             auto_connect: 是否自动连接到 Trae CN
             timeout: 超时时间（秒）
+            use_seqpacket: 是否优先尝试 SOCK_SEQPACKET（对端不支持时回退到 SOCK_STREAM）
+            rcvbuf: socket 接收缓冲区大小（字节）
+            sndbuf: socket 发送缓冲区大小（字节）
         """
         # 自动检测 socket 路径
         if socket_path is None:
@@ -93,15 +305,29 @@ class IPCCommunicator:
         self.timeout = timeout
         self.socket: Optional[socket.socket] = None
         self.connected = False
-        self.request_id = 0
-        self.lock = threading.Lock()
+        self.use_seqpacket = use_seqpacket
+        # 当前连接是否为 SOCK_SEQPACKET（由内核保证消息边界）
+        self._seqpacket = False
+        self.rcvbuf = rcvbuf
+        self.sndbuf = sndbuf
+        # 请求 ID 生成器（next() 在 CPython 中是原子操作，无需加锁）
+        self._id_gen = itertools.count(1)
+
+        # 监听线程的 selector 及唤醒用 socketpair（disconnect 时写入以解除阻塞）
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wakeup_r: Optional[socket.socket] = None
+        self._wakeup_w: Optional[socket.socket] = None
+
+        # 预分配的接收缓冲区，监听线程通过 recv_into 直接读入
+        self._recv_buf = bytearray(65536)
+        self._recv_mv = memoryview(self._recv_buf)
 
         # 回调函数
         self.notification_callback: Optional[Callable] = None
 
-        # 响应存储
-        self.pending_responses: Dict[str, Any] = {}
-        self.response_event = threading.Event()
+        # 等待中的请求：请求 ID -> 响应 Future
+        # 只做单键的登记和 pop，这些 dict 操作在 CPython 中是原子的，无需加锁
+        self.pending_responses: Dict[str, Future] = {}
 
         # 自动连接
         if auto_connect:
@@ -114,25 +340,7 @@ class IPCCommunicator:
         Returns:
             socket 路径
         """
-        base_path = os.path.expanduser(
-            "~/Library/Application Support/Trae CN"
-        )
-
-        # 查找最新的 socket 文件
-        socket_patterns = [
-            os.path.join(base_path, "*.sock"),
-            os.path.join(base_path, "*main.sock"),
-        ]
-
-        for pattern in socket_patterns:
-            import glob
-            sockets = glob.glob(pattern)
-            if sockets:
-                # 返回最新的 socket
-                return max(sockets, key=os.path.getmtime)
-
-        # 默认路径
-        return os.path.join(base_path, "1.10-main.sock")
+        return _detect_socket_path()
 
     def connect(self) -> bool:
         """
@@ -141,6 +349,18 @@ class IPCCommunicator:
         Returns:
             是否连接成功
         """
+        # 已连接时直接返回，避免覆盖旧 socket 导致其监听线程永远阻塞在 select 上
+        if self.is_connected():
+            return True
+
+        # 对端已关闭的旧连接（监听线程已退出）先释放
+        if self.socket is not None:
+            try:
+                self.socket.close()
+            except OSError:
+                pass
+            self.socket = None
+
         try:
             logger.info(f"尝试连接到: {self.socket_path}")
 
@@ -150,13 +370,24 @@ class IPCCommunicator:
                 return False
 
             # 创建 socket
-            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            self.socket.settimeout(self.timeout)
-            self.socket.connect(self.socket_path)
+            self.socket = self._connect_seqpacket() if self.use_seqpacket else None
+            self._seqpacket = self.socket is not None
+            if self.socket is None:
+                self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.socket.settimeout(self.timeout)
+                self.socket.connect(self.socket_path)
+
+            _tune_socket(self.socket, self.rcvbuf, self.sndbuf)
 
             self.connected = True
             logger.info("✅ 成功连接到 Trae CN")
 
+            # 监听线程通过 selector 同时等待数据和唤醒信号，空闲时不产生系统调用
+            self._wakeup_r, self._wakeup_w = socket.socketpair()
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.socket, selectors.EVENT_READ)
+            self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+
             # 启动监听线程
             self.listen_thread = threading.Thread(
                 target=self._listen_loop,
@@ -171,15 +402,54 @@ class IPCCommunicator:
             self.connected = False
             return False
 
+    def _connect_seqpacket(self) -> Optional[socket.socket]:
+        """
+        尝试以 SOCK_SEQPACKET 连接
+
+        Returns:
+            已连接的 socket，平台或对端不支持时返回 None
+        """
+        if not hasattr(socket, 'SOCK_SEQPACKET'):
+            return None
+
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        except OSError:
+            return None
+
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            logger.debug(f"SOCK_SEQPACKET 不可用，回退到 SOCK_STREAM: {e}")
+            return None
+
+        # 每次 recv 读取一条完整消息，缓冲区需容纳最大消息
+        if len(self._recv_buf) < _SEQPACKET_MAX_MESSAGE:
+            self._recv_buf = bytearray(_SEQPACKET_MAX_MESSAGE)
+            self._recv_mv = memoryview(self._recv_buf)
+
+        logger.info("使用 SOCK_SEQPACKET 连接")
+        return sock
+
     def disconnect(self):
         """断开连接"""
         if self.socket:
+            self.connected = False
+
+            # 唤醒阻塞在 select 上的监听线程
+            if self._wakeup_w is not None:
+                try:
+                    self._wakeup_w.send(b'\0')
+                except OSError:
+                    pass
+
             try:
                 self.socket.close()
-            except:
+            except OSError:
                 pass
             self.socket = None
-            self.connected = False
             logger.info("已断开连接")
 
     def is_connected(self) -> bool:
@@ -188,54 +458,85 @@ class IPCCommunicator:
 
     def _listen_loop(self):
         """监听来自 Trae CN 的消息"""
-        buffer = ""
+        # 按字节累积，只对完整的行解码，避免多字节字符被分块截断
+        buffer = bytearray()
+        # 取本地引用，重新连接时不会影响本线程的清理
+        selector = self._selector
+        wakeup, wakeup_w = self._wakeup_r, self._wakeup_w
 
-        while self.connected and self.socket:
-            try:
-                data = self.socket.recv(4096)
-                if not data:
-                    logger.warning("连接已关闭")
-                    self.connected = False
-                    break
-
-                # 解码数据
+        try:
+            while self.connected and self.socket:
                 try:
-                    message = data.decode('utf-8')
-                except:
-                    continue
-
-                buffer += message
-
-                # 处理完整的 JSON 行
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-
-                    if line.strip():
-                        self._handle_message(line.strip())
-
-            except socket.timeout:
-                continue
-            except Exception as e:
-                logger.error(f"监听错误: {e}")
-                break
-
-    def _handle_message(self, message: str):
+                    ready = selector.select()
+                    if any(key.fileobj is wakeup for key, _ in ready):
+                        break
+
+                    count = self.socket.recv_into(self._recv_mv)
+                    if not count:
+                        logger.warning("连接已关闭")
+                        self.connected = False
+                        break
+
+                    # SOCK_SEQPACKET: 一次 recv 即一条完整消息，无需分帧
+                    if self._seqpacket:
+                        line = bytes(self._recv_mv[:count]).strip()
+                        if line:
+                            self._handle_message(line)
+                        continue
+
+                    buffer.extend(self._recv_mv[:count])
+
+                    # 处理完整的 JSON 行：按偏移扫描，最后统一删除已处理部分
+                    start = 0
+                    while True:
+                        index = buffer.find(b'\n', start)
+                        if index < 0:
+                            break
+
+                        line = bytes(buffer[start:index]).strip()
+                        start = index + 1
+
+                        if line:
+                            self._handle_message(line)
+
+                    if start:
+                        del buffer[:start]
+
+                except Exception as e:
+                    if self.connected:
+                        logger.error(f"监听错误: {e}")
+                    break
+        finally:
+            selector.close()
+            wakeup.close()
+            wakeup_w.close()
+            # 仍是当前连接时才清理（重新连接后的请求属于新的监听线程）
+            if self._wakeup_w is wakeup_w:
+                self._wakeup_w = None
+
+                # 连接结束后不会再有响应，立即让等待中的请求失败
+                pending, self.pending_responses = self.pending_responses, {}
+                for future in pending.values():
+                    if not future.done():
+                        future.set_exception(IPCError("连接已关闭"))
+
+    def _handle_message(self, message: bytes):
         """
         处理接收到的消息
 
         Args:
-            message: JSON 格式的消息
+            message: 一行 JSON 格式的消息（UTF-8 字节串）
         """
         try:
-            data = json.loads(message)
+            data = _loads(message)
             msg_type = data.get('type', 'unknown')
 
             if msg_type == 'response':
                 # 处理响应
                 req_id = data.get('id')
-                if req_id and req_id in self.pending_responses:
-                    self.pending_responses[req_id] = data
-                    self.response_event.set()
+                future = self.pending_responses.pop(req_id, None)
+                if future is not None:
+                    future.set_result(data)
 
             elif msg_type == 'notification':
                 # 处理通知
@@ -270,36 +571,31 @@ class IPCCommunicator:
             raise IPCError("未连接到 Trae CN")
 
         # 生成请求 ID
-        with self.lock:
-            self.request_id += 1
-            req_id = str(self.request_id)
+        req_id = str(next(self._id_gen))
 
         # 构建请求
-        request = {
-            'id': req_id,
-            'type': 'request',
-            'method': method,
-            'params': params or {}
-        }
+        request = _encode_request(req_id, method, params)
+
+        # 先登记再发送，避免响应先于登记到达
+        future: Optional[Future] = None
+        if wait_response:
+            future = Future()
+            self.pending_responses[req_id] = future
 
         # 发送请求
         try:
-            message = json.dumps(request) + '\n'
-            self.socket.sendall(message.encode('utf-8'))
+            _sendmsg_all(self.socket, request)
             logger.info(f"发送请求: {method}")
 
             # 等待响应
-            if wait_response:
-                self.pending_responses[req_id] = None
-                self.response_event.clear()
-
-                # 等待响应或超时
-                if not self.response_event.wait(self.timeout):
-                    del self.pending_responses[req_id]
+            if future is not None:
+                # 只等待本请求自己的响应，互不唤醒
+                try:
+                    response = future.result(self.timeout)
+                except FutureTimeoutError:
+                    self.pending_responses.pop(req_id, None)
                     raise IPCError(f"请求超时: {method}", -32000)
 
-                response = self.pending_responses.pop(req_id)
-
                 # 检查错误
                 if 'error' in response:
                     error = response['error']
@@ -314,6 +610,7 @@ class IPCCommunicator:
             return {'id': req_id, 'status': 'sent'}
 
         except socket.error as e:
+            self.pending_responses.pop(req_id, None)
             self.connected = False
             raise IPCError(f"发送失败: {e}")
 
@@ -328,15 +625,10 @@ class IPCCommunicator:
         if not self.is_connected():
             raise IPCError("未连接到 Trae CN")
 
-        request = {
-            'type': 'notification',
-            'method': method,
-            'params': params or {}
-        }
+        request = _encode_notification(method, params)
 
         try:
-            message = json.dumps(request) + '\n'
-            self.socket.sendall(message.encode('utf-8'))
+            _sendmsg_all(self.socket, request)
             logger.info(f"发送通知: {method}")
         except socket.error as e:
             self.connected = False
@@ -382,6 +674,315 @@ class IPCCommunicator:
         self.disconnect()
 
 
+class AsyncIPCCommunicator:
+    """
+    Trae CN IPC 异步通信器
+
+    基于 asyncio 的单线程实现：一个读取任务按请求 ID 分发响应，
+    多个请求可以同时在途，无需监听线程和锁
+
+    使用示例：
+    ```python
+    async with AsyncIPCCommunicator() as ipc:
+        info, qualification = await asyncio.gather(
+            ipc.get_user_info(),
+            ipc.get_solo_qualification()
+        )
+    ```
+    """
+
+    def __init__(
+        self,
+        socket_path: str = None,
+        timeout: int = 30,
+        rcvbuf: int = _DEFAULT_SOCKET_BUFFER,
+        sndbuf: int = _DEFAULT_SOCKET_BUFFER
+    ):
+        """
+        初始化异步 IPC 通信器
+
+        Args:
+            socket_path: Unix Socket 路径，如果为 None 则自动检测
+            timeout: 超时时间（秒）
+            rcvbuf: socket 接收缓冲区大小（字节）
+            sndbuf: socket 发送缓冲区大小（字节）
+        """
+        if socket_path is None:
+            socket_path = _detect_socket_path()
+
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.rcvbuf = rcvbuf
+        self.sndbuf = sndbuf
+        self.connected = False
+
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._id_gen = itertools.count(1)
+
+        # 回调函数
+        self.notification_callback: Optional[Callable] = None
+
+        # 等待中的请求：请求 ID -> 响应 Future
+        self.pending_responses: Dict[str, asyncio.Future] = {}
+
+    async def connect(self) -> bool:
+        """
+        连接到 Trae CN
+
+        Returns:
+            是否连接成功
+        """
+        logger.info(f"尝试连接到: {self.socket_path}")
+
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(
+                    self.socket_path,
+                    limit=_ASYNC_STREAM_LIMIT
+                ),
+                self.timeout
+            )
+        except FileNotFoundError:
+            logger.warning(f"Socket 不存在: {self.socket_path}")
+            return False
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.error(f"连接失败: {e}")
+            return False
+
+        _tune_socket(self._writer.get_extra_info('socket'), self.rcvbuf, self.sndbuf)
+
+        self.connected = True
+        logger.info("✅ 成功连接到 Trae CN")
+
+        # 启动读取任务
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_loop())
+        return True
+
+    async def disconnect(self):
+        """断开连接"""
+        if self._writer is None:
+            return
+
+        self.connected = False
+
+        self._reader_task.cancel()
+        try:
+            await self._reader_task
+        except asyncio.CancelledError:
+            pass
+
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except OSError:
+            pass
+
+        self._reader = self._writer = self._reader_task = None
+        logger.info("已断开连接")
+
+    def is_connected(self) -> bool:
+        """检查是否已连接"""
+        return self.connected and self._writer is not None
+
+    async def _read_loop(self):
+        """
+        读取来自 Trae CN 的消息，按行分发
+
+        每次唤醒尽量读取已到达的全部数据，并一次性分发其中所有完整的行，
+        消息密集时不必为每一行单独等待
+        """
+        buffer = bytearray()
+
+        try:
+            while True:
+                chunk = await self._reader.read(_ASYNC_READ_SIZE)
+                if not chunk:
+                    logger.warning("连接已关闭")
+                    break
+
+                buffer.extend(chunk)
+
+                # 处理完整的 JSON 行
+                start = 0
+                while True:
+                    index = buffer.find(b'\n', start)
+                    if index < 0:
+                        break
+
+                    line = bytes(buffer[start:index]).strip()
+                    start = index + 1
+
+                    if line:
+                        self._handle_message(line)
+
+                if start:
+                    del buffer[:start]
+        except Exception as e:
+            logger.error(f"监听错误: {e}")
+        finally:
+            self.connected = False
+
+            # 连接结束后不会再有响应，立即让等待中的请求失败
+            pending, self.pending_responses = self.pending_responses, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(IPCError("连接已关闭"))
+
+    def _handle_message(self, message: bytes):
+        """
+        处理接收到的消息
+
+        Args:
+            message: 一行 JSON 格式的消息（UTF-8 字节串）
+        """
+        try:
+            data = _loads(message)
+            msg_type = data.get('type', 'unknown')
+
+            if msg_type == 'response':
+                # 处理响应
+                future = self.pending_responses.pop(data.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(data)
+
+            elif msg_type == 'notification':
+                # 处理通知
+                if self.notification_callback:
+                    self.notification_callback(data)
+
+            logger.debug(f"收到消息: {msg_type}")
+
+        except json.JSONDecodeError:
+            logger.warning(f"无效的 JSON 消息: {message[:100]}")
+        except Exception as e:
+            logger.error(f"处理消息错误: {e}")
+
+    async def send_request(
+        self,
+        method: str,
+        params: dict = None,
+        wait_response: bool = True
+    ) -> dict:
+        """
+        发送请求
+
+        Args:
+            method: 方法名
+            params: 参数
+            wait_response: 是否等待响应
+
+        Returns:
+            响应数据
+        """
+        if not self.is_connected():
+            raise IPCError("未连接到 Trae CN")
+
+        req_id = str(next(self._id_gen))
+
+        # 构建请求
+        request = _encode_request(req_id, method, params)
+
+        # 先登记再发送，避免响应先于登记到达
+        future: Optional[asyncio.Future] = None
+        if wait_response:
+            future = asyncio.get_running_loop().create_future()
+            self.pending_responses[req_id] = future
+
+        # 发送请求
+        try:
+            self._writer.writelines(request)
+            await self._writer.drain()
+        except OSError as e:
+            self.pending_responses.pop(req_id, None)
+            self.connected = False
+            raise IPCError(f"发送失败: {e}")
+
+        logger.info(f"发送请求: {method}")
+
+        if future is None:
+            return {'id': req_id, 'status': 'sent'}
+
+        # 等待响应
+        try:
+            response = await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            self.pending_responses.pop(req_id, None)
+            raise IPCError(f"请求超时: {method}", -32000)
+
+        # 检查错误
+        if 'error' in response:
+            error = response['error']
+            raise IPCError(
+                error.get('message', '未知错误'),
+                error.get('code', -1),
+                error
+            )
+
+        return response.get('result', {})
+
+    async def send_notification(self, method: str, params: dict = None):
+        """
+        发送通知（不需要响应）
+
+        Args:
+            method: 方法名
+            params: 参数
+        """
+        if not self.is_connected():
+            raise IPCError("未连接到 Trae CN")
+
+        request = _encode_notification(method, params)
+
+        try:
+            self._writer.writelines(request)
+            await self._writer.drain()
+            logger.info(f"发送通知: {method}")
+        except OSError as e:
+            self.connected = False
+            raise IPCError(f"发送失败: {e}")
+
+    def set_notification_callback(self, callback: Callable):
+        """
+        设置通知回调函数
+
+        Args:
+            callback: 回调函数
+        """
+        self.notification_callback = callback
+
+    async def get_user_info(self) -> dict:
+        """获取用户信息"""
+        return await self.send_request("getUserInfo")
+
+    async def get_solo_qualification(self) -> dict:
+        """获取 Solo 资格"""
+        return await self.send_request("getSoloQualification")
+
+    async def send_chat_message(self, message: str, **kwargs) -> dict:
+        """发送聊天消息"""
+        return await self.send_request("sendChatMessage", {
+            'message': message,
+            **kwargs
+        })
+
+    async def execute_command(self, command: str) -> dict:
+        """执行命令"""
+        return await self.send_request("executeCommand", {
+            'command': command
+        })
+
+    async def __aenter__(self):
+        """异步上下文管理器进入"""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """异步上下文管理器退出"""
+        await self.disconnect()
+
+
 class MockIPCCommunicator(IPCCommunicator):
     """
     模拟 IPC 通信器
@@ -32,15 +32,22 @@ import sys
 import json
 import time
 import socket
+import selectors
 import struct
 import threading
 import logging
 import subprocess
-from typing import Optional, Callable, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Union, Deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import argparse
+from collections import Counter, deque
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
 
 logging.basicConfig(
     level=logging.INFO,
@@ -48,6 +55,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 默认的 socket 收发缓冲区大小
+_DEFAULT_SOCKET_BUFFER = 4 * 1024 * 1024
+
+# 消息历史保留的最大条数（超出后丢弃最早的消息）
+_MAX_HISTORY = 10000
+
+# VS Code IPC 帧头（4 字节大端序长度）及允许的最大帧长度
+_FRAME_HEADER = struct.Struct('>I')
+_MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    序列化为 UTF-8 编码的 JSON 字节串
+
+    优先使用 orjson，未安装时回退到标准库 json
+
+    Args:
+        obj: 待序列化对象
+
+    Returns:
+        bytes: JSON 字节串
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """反序列化 JSON（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _tune_socket(sock: socket.socket, rcvbuf: int, sndbuf: int):
+    """
+    设置 socket 收发缓冲区大小
+
+    Unix Socket 默认缓冲区较小，大消息需要多次往返读取；
+    系统上限不足时保持默认值
+
+    Args:
+        sock: socket 对象
+        rcvbuf: 接收缓冲区大小（字节）
+        sndbuf: 发送缓冲区大小（字节）
+    """
+    for option, size in ((socket.SO_RCVBUF, rcvbuf), (socket.SO_SNDBUF, sndbuf)):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, size)
+        except OSError as e:
+            logger.debug(f"设置 socket 缓冲区失败: {e}")
+
 
 @dataclass
 class IPCMessage:
@@ -74,7 +134,9 @@ class TraeIPCProxy:
         self,
         socket_path: str = None,
         listen_port: int = 12581,
-        output_file: str = None
+        output_file: str = None,
+        rcvbuf: int = _DEFAULT_SOCKET_BUFFER,
+        sndbuf: int = _DEFAULT_SOCKET_BUFFER
     ):
         """
         初始化代理
@@ -83,6 +145,8 @@ class TraeIPCProxy:
             socket_path: Trae CN socket 路径
             listen_port: 代理监听端口
             output_file: 输出日志文件
+            rcvbuf: socket 接收缓冲区大小（字节）
+            sndbuf: socket 发送缓冲区大小（字节）
         """
         if socket_path is None:
             socket_path = os.path.expanduser(
@@ -92,11 +156,23 @@ class TraeIPCProxy:
         self.socket_path = socket_path
         self.listen_port = listen_port
         self.output_file = output_file
+        self.rcvbuf = rcvbuf
+        self.sndbuf = sndbuf
 
         self.running = False
-        self.messages: List[IPCMessage] = []
+        # stop() 时置位，start() 阻塞等待该事件而非轮询 running
+        self._stop_event = threading.Event()
+        self.messages: Deque[IPCMessage] = deque(maxlen=_MAX_HISTORY)
+        # 各格式的消息计数（覆盖整个会话，不受历史条数上限影响）
+        self._format_counts: Counter = Counter()
         self.message_callback: Optional[Callable] = None
 
+        # 监听线程的 selector 及唤醒用 socketpair（stop 时写入以解除阻塞）
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wakeup_r: Optional[socket.socket] = None
+        self._wakeup_w: Optional[socket.socket] = None
+        self._listen_thread: Optional[threading.Thread] = None
+
         # 代理 socket
         self.server_socket: Optional[socket.socket] = None
         self.client_socket: Optional[socket.socket] = None
@@ -105,6 +181,13 @@ class TraeIPCProxy:
         # 日志文件
         self.log_file = None
 
+        # 预分配的接收缓冲区，监听线程通过 recv_into 直接读入
+        self._recv_buf = bytearray(65536)
+        self._recv_mv = memoryview(self._recv_buf)
+
+        # 跨 recv 累积的未完成数据，由 _split_frames 切分成完整消息
+        self._frame_buf = bytearray()
+
     def _init_logging(self):
         """初始化日志文件"""
         if self.output_file:
@@ -133,7 +216,7 @@ class TraeIPCProxy:
                 formatted = json.dumps(message.parsed_data, indent=2, ensure_ascii=False)
                 for line in formatted.split('\n')[:10]:  # 限制输出行数
                     logger.info(f"   {line}")
-            except:
+            except (TypeError, ValueError):
                 logger.info(f"   {message.parsed_data}")
 
         # 写入文件
@@ -141,8 +224,9 @@ class TraeIPCProxy:
             self.log_file.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
             self.log_file.flush()
 
-        # 存储消息
+        # 存储消息（历史已满时 deque 自动丢弃最早的消息）
         self.messages.append(message)
+        self._format_counts[message.parsed_data.get('format', 'unknown')] += 1
 
         # 调用回调
         if self.message_callback:
@@ -170,47 +254,75 @@ class TraeIPCProxy:
 
         # 尝试 VS Code IPC 格式（4字节大端序长度前缀）
         if len(data) >= 4:
-            try:
-                length = struct.unpack('>I', data[:4])[0]
-                content = data[4:]
-                if len(content) == length:
-                    try:
-                        json_data = json.loads(content.decode('utf-8'))
-                        result['format'] = 'vscode_ipc'
-                        result['header_length'] = 4
-                        result['body_length'] = length
-                        result['json'] = json_data
-                        return result
-                    except json.JSONDecodeError:
-                        pass
-            except struct.error:
-                pass
-
-        # 尝试标准 JSON 行格式
-        try:
-            text = data.decode('utf-8').strip()
-            if text.startswith('{') and text.endswith('}'):
-                json_data = json.loads(text)
-                result['format'] = 'json_line'
-                result['json'] = json_data
-                return result
-        except:
-            pass
+            length = _FRAME_HEADER.unpack_from(data, 0)[0]
+            if len(data) - 4 == length:
+                try:
+                    json_data = _loads(data[4:])
+                    result['format'] = 'vscode_ipc'
+                    result['header_length'] = 4
+                    result['body_length'] = length
+                    result['json'] = json_data
+                    return result
+                except ValueError:  # 含 JSON 与 UTF-8 解码错误
+                    pass
+
+        # 尝试标准 JSON 行格式 / JSON 数组
+        # 先用首尾字节判断，格式明显不符时不进入解析和异常路径
+        body = data.strip()
+        if body[:1] == b'{' and body[-1:] == b'}':
+            fmt = 'json_line'
+        elif body[:1] == b'[' and body[-1:] == b']':
+            fmt = 'json_array'
+        else:
+            fmt = None
 
-        # 尝试 JSON 数组
-        try:
-            text = data.decode('utf-8').strip()
-            if text.startswith('[') and text.endswith(']'):
-                json_data = json.loads(text)
-                result['format'] = 'json_array'
+        if fmt:
+            try:
+                json_data = _loads(body)
+                result['format'] = fmt
                 result['json'] = json_data
                 return result
-        except:
-            pass
+            except ValueError:  # 含 JSON 与 UTF-8 解码错误
+                pass
 
         result['format'] = 'unknown'
         return result
 
+    def _split_frames(self) -> List[bytes]:
+        """
+        从累积缓冲区中切出完整消息
+
+        帧头长度合理时按 VS Code IPC 长度前缀分帧，不完整的帧留待下次接收；
+        帧头不合理（非长度前缀格式）时把已缓冲的数据整体作为一条消息
+
+        Returns:
+            完整消息列表（长度前缀帧包含 4 字节帧头）
+        """
+        buf = self._frame_buf
+        size = len(buf)
+        frames = []
+
+        # 按偏移扫描，最后统一删除已切出的部分，避免每帧移动剩余数据
+        offset = 0
+        while size - offset >= 4:
+            length = _FRAME_HEADER.unpack_from(buf, offset)[0]
+            if length > _MAX_FRAME_SIZE:
+                frames.append(bytes(buf[offset:]))
+                offset = size
+                break
+
+            end = offset + 4 + length
+            if size < end:
+                break
+
+            frames.append(bytes(buf[offset:end]))
+            offset = end
+
+        if offset:
+            del buf[:offset]
+
+        return frames
+
     def start(self, timeout: float = 10.0) -> bool:
         """
         启动代理
@@ -235,27 +347,34 @@ class TraeIPCProxy:
             self.trae_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             self.trae_socket.settimeout(timeout)
             self.trae_socket.connect(self.socket_path)
+            _tune_socket(self.trae_socket, self.rcvbuf, self.sndbuf)
 
             logger.info("✅ 成功连接到 Trae CN")
 
             self.running = True
+            self._stop_event.clear()
             self._init_logging()
 
+            # 监听线程通过 selector 同时等待数据和唤醒信号，空闲时不产生系统调用
+            self._wakeup_r, self._wakeup_w = socket.socketpair()
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.trae_socket, selectors.EVENT_READ)
+            self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+
             # 启动监听线程
-            listen_thread = threading.Thread(
+            self._listen_thread = threading.Thread(
                 target=self._listen_loop,
                 daemon=True
             )
-            listen_thread.start()
+            self._listen_thread.start()
 
             logger.info("🎧 开始监听 IPC 通信...")
             logger.info("   请在 Trae CN 中执行一些操作来触发通信")
             logger.info("   按 Ctrl+C 停止监听")
 
-            # 保持主线程运行
+            # 保持主线程运行，直到 stop() 被调用
             try:
-                while self.running:
-                    time.sleep(1)
+                self._stop_event.wait()
             except KeyboardInterrupt:
                 logger.info("\n⏹️  收到停止信号")
                 self.stop()
@@ -268,37 +387,47 @@ class TraeIPCProxy:
 
     def _listen_loop(self):
         """监听循环"""
-        buffer = b''
+        # 取本地引用，重新启动时不会影响本线程的清理
+        selector = self._selector
+        wakeup, wakeup_w = self._wakeup_r, self._wakeup_w
 
-        while self.running and self.trae_socket:
-            try:
-                # 接收数据
-                self.trae_socket.settimeout(1.0)
-                chunk = self.trae_socket.recv(4096)
+        try:
+            while self.running and self.trae_socket:
+                try:
+                    # 等待数据或停止信号
+                    ready = selector.select()
+                    if any(key.fileobj is wakeup for key, _ in ready):
+                        break
 
-                if not chunk:
-                    logger.warning("连接已关闭")
-                    break
+                    # 接收数据
+                    count = self.trae_socket.recv_into(self._recv_mv)
 
-                # 记录原始数据
-                message = IPCMessage(
-                    direction='incoming',
-                    raw_data=chunk,
-                    size=len(chunk)
-                )
+                    if not count:
+                        logger.warning("连接已关闭")
+                        break
 
-                # 尝试解析
-                message.parsed_data = self._parse_message(chunk)
+                    self._frame_buf.extend(self._recv_mv[:count])
 
-                # 记录消息
-                self._log_message(message)
+                    for frame in self._split_frames():
+                        # 记录原始数据
+                        message = IPCMessage(direction='incoming', raw_data=frame, size=len(frame))
 
-            except socket.timeout:
-                continue
-            except Exception as e:
-                if self.running:
-                    logger.error(f"监听错误: {e}")
-                break
+                        # 尝试解析
+                        message.parsed_data = self._parse_message(frame)
+
+                        # 记录消息
+                        self._log_message(message)
+
+                except Exception as e:
+                    if self.running:
+                        logger.error(f"监听错误: {e}")
+                    break
+        finally:
+            selector.close()
+            wakeup.close()
+            wakeup_w.close()
+            if self._wakeup_w is wakeup_w:
+                self._wakeup_w = None
 
     def send_message(self, data: dict):
         """
@@ -313,23 +442,25 @@ class TraeIPCProxy:
 
         try:
             # 序列化消息
-            content = json.dumps(data, ensure_ascii=False)
-            content_bytes = content.encode('utf-8')
+            content_bytes = _dumps(data)
 
             # 尝试添加长度前缀
-            header = struct.pack('>I', len(content_bytes))
+            header = _FRAME_HEADER.pack(len(content_bytes))
             message_bytes = header + content_bytes
 
             # 发送
             self.trae_socket.sendall(message_bytes)
 
-            # 记录发送的消息
-            message = IPCMessage(
-                direction='outgoing',
-                raw_data=message_bytes,
-                size=len(message_bytes),
-                parsed_data=self._parse_message(message_bytes)
-            )
+            # 记录发送的消息（格式和内容已知，无需再解析一次）
+            message = IPCMessage(direction='outgoing', raw_data=message_bytes, size=len(message_bytes))
+            message.parsed_data = {
+                'raw_preview': message_bytes[:100].decode('utf-8', errors='replace'),
+                'length': len(message_bytes),
+                'format': 'vscode_ipc',
+                'header_length': 4,
+                'body_length': len(content_bytes),
+                'json': data
+            }
             self._log_message(message)
 
         except Exception as e:
@@ -339,11 +470,20 @@ class TraeIPCProxy:
         """停止代理"""
         self.running = False
 
+        # 唤醒监听线程并等待其退出，避免其在日志文件关闭后继续写入
+        if self._wakeup_w is not None:
+            try:
+                self._wakeup_w.send(b'\0')
+            except OSError:
+                pass
+        if self._listen_thread and self._listen_thread is not threading.current_thread():
+            self._listen_thread.join(timeout=1.0)
+
         # 关闭 socket
         if self.trae_socket:
             try:
                 self.trae_socket.close()
-            except:
+            except OSError:
                 pass
 
         # 关闭日志文件
@@ -353,9 +493,12 @@ class TraeIPCProxy:
         logger.info("🛑 代理已停止")
         self._print_summary()
 
+        # 清理完成后再放行 start()
+        self._stop_event.set()
+
     def _print_summary(self):
         """打印通信汇总"""
-        if not self.messages:
+        if not self._format_counts:
             logger.info("没有捕获到任何消息")
             return
 
@@ -364,15 +507,8 @@ class TraeIPCProxy:
         logger.info("=" * 60)
 
         # 按格式分组
-        formats = {}
-        for msg in self.messages:
-            fmt = msg.parsed_data.get('format', 'unknown')
-            if fmt not in formats:
-                formats[fmt] = 0
-            formats[fmt] += 1
-
-        logger.info(f"总消息数: {len(self.messages)}")
-        for fmt, count in formats.items():
+        logger.info(f"总消息数: {sum(self._format_counts.values())}")
+        for fmt, count in self._format_counts.items():
             logger.info(f"  {fmt}: {count} 条")
 
         # 尝试提取协议模板
@@ -387,12 +523,13 @@ class TraeIPCProxy:
                     break
 
     def get_messages(self) -> List[IPCMessage]:
-        """获取所有消息"""
-        return self.messages
+        """获取消息历史（最多保留最近 _MAX_HISTORY 条）"""
+        return list(self.messages)
 
     def clear_messages(self):
         """清空消息历史"""
         self.messages.clear()
+        self._format_counts.clear()
 
 
 class TraeIPCAnalyzer:
@@ -402,6 +539,34 @@ class TraeIPCAnalyzer:
     通过发送测试消息来探测协议格式
     """
 
+    # 测试消息列表（常量字节串，类定义时构建一次）
+    TEST_MESSAGES = (
+        {
+            'name': 'VS Code IPC (长度前缀)',
+            'data': b'\x00\x00\x00\x1b{"type":1,"method":"ping"}'
+        },
+        {
+            'name': 'VS Code IPC (带 ID)',
+            'data': b'\x00\x00\x00\x21{"id":"1","type":1,"method":"ping"}'
+        },
+        {
+            'name': 'JSON 行',
+            'data': b'{"type":1,"method":"ping"}\n'
+        },
+        {
+            'name': '简单 JSON',
+            'data': b'{"method":"ping"}'
+        },
+        {
+            'name': 'ping 文本',
+            'data': b'ping\n'
+        },
+        {
+            'name': 'VS Code 实际格式示例',
+            'data': b'\x00\x00\x00\x2f{"id":"1","type":1,"method":"$getConfiguration","params":{}}'
+        }
+    )
+
     def __init__(self, socket_path: str = None):
         """初始化"""
         if socket_path is None:
@@ -435,35 +600,7 @@ class TraeIPCAnalyzer:
 
             logger.info("✅ 连接到 socket")
 
-            # 测试消息列表
-            test_messages = [
-                {
-                    'name': 'VS Code IPC (长度前缀)',
-                    'data': b'\x00\x00\x00\x1b{"type":1,"method":"ping"}'
-                },
-                {
-                    'name': 'VS Code IPC (带 ID)',
-                    'data': b'\x00\x00\x00\x21{"id":"1","type":1,"method":"ping"}'
-                },
-                {
-                    'name': 'JSON 行',
-                    'data': b'{"type":1,"method":"ping"}\n'
-                },
-                {
-                    'name': '简单 JSON',
-                    'data': b'{"method":"ping"}'
-                },
-                {
-                    'name': 'ping 文本',
-                    'data': b'ping\n'
-                },
-                {
-                    'name': 'VS Code 实际格式示例',
-                    'data': b'\x00\x00\x00\x2f{"id":"1","type":1,"method":"$getConfiguration","params":{}}'
-                }
-            ]
-
-            for test in test_messages:
+            for test in self.TEST_MESSAGES:
                 try:
                     logger.info(f"\n测试: {test['name']}")
                     logger.info(f"  发送: {test['data'][:50]}")
@@ -486,13 +623,12 @@ class TraeIPCAnalyzer:
                         try:
                             # 尝试去除长度前缀
                             if len(response) >= 4:
-                                resp_length = struct.unpack('>I', response[:4])[0]
-                                resp_content = response[4:]
-                                if len(resp_content) == resp_length:
+                                resp_length = _FRAME_HEADER.unpack_from(response, 0)[0]
+                                if len(response) - 4 == resp_length:
                                     logger.info(f"  (长度前缀验证通过)")
-                                    json_data = json.loads(resp_content.decode('utf-8'))
+                                    json_data = _loads(response[4:])
                                     logger.info(f"  JSON: {json_data}")
-                        except:
+                        except ValueError:  # 含 JSON 与 UTF-8 解码错误
                             pass
 
                 except socket.timeout:
@@ -6,7 +6,8 @@ Trae CN 启动器 - 带开发者工具和调试功能
 通过不同的启动参数控制 Trae CN 的启动模式，支持调试模式、开发者模式等。
 
 使用方法：
-    python3 launch_traе.py
+    python3 launch_traе.py                  # 交互式选择
+    python3 launch_traе.py --mode inspect   # 直接指定模式
 
 功能：
 1. 带 --inspect 启动（可连接调试器）
@@ -19,139 +20,490 @@ Trae CN 启动器 - 带开发者工具和调试功能
 """
 
 import os
+import re
+import argparse
 import sys
-import subprocess
-import time
+import ctypes
+import shutil
+import asyncio
 import signal
 from datetime import datetime
+from typing import Dict, NamedTuple, Optional, Tuple
+
+try:
+    import uvloop
+except ImportError:  # uvloop 为可选依赖，缺失时使用默认事件循环
+    uvloop = None
 
 # 配置
 TRAE_APP_PATH = "/Volumes/600g/Applications/Trae CN.app"
 DEBUG_PORT = 9222
 REMOTE_DEBUG_PORT = 9229
+NODE_INSPECT_DEFAULT_PORT = 9229  # 不带端口的 --inspect 使用的默认端口
 
+# 等待调试端口就绪的超时与探测间隔（秒）
+PORT_READY_TIMEOUT = 5.0
+_PORT_POLL_INTERVAL = 0.05
 
-def kill_existing_traе():
-    """关闭已运行的 Trae CN"""
-    print("🔍 检查已运行的 Trae CN...")
+# 进程命令行匹配模式（与 pgrep -f 'Trae CN' 等价）
+TRAE_PROCESS_NAME = 'Trae CN'
+_TRAE_PROCESS_PATTERN = re.compile(re.escape(TRAE_PROCESS_NAME.encode()))
 
-    try:
-        # 查找 Trae CN 进程
-        result = subprocess.run(
-            ['pgrep', '-f', 'Trae CN'],
-            capture_output=True,
-            text=True
-        )
+# macOS libproc：PROC_ALL_PIDS/PROC_PGRP_ONLY 与 proc_pidpath 缓冲区大小
+_LIBPROC_PATH = '/usr/lib/libproc.dylib'
+_PROC_ALL_PIDS = 1
+_PROC_PGRP_ONLY = 2
+_PROC_PIDPATHINFO_MAXSIZE = 4096
 
-        if result.returncode == 0:
-            pids = result.stdout.strip().split('\n')
-            for pid in pids:
-                if pid:
-                    print(f"   关闭进程 {pid}...")
-                    try:
-                        os.kill(int(pid), signal.SIGTERM)
-                    except:
-                        pass
-            time.sleep(1)
-            print("✅ 已关闭现有进程")
-        else:
-            print("   没有运行的 Trae CN 进程")
+# 发送 SIGTERM 后轮询进程退出的退避间隔（秒），总计不超过 1 秒
+_EXIT_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.25)
+_EXIT_WAIT_TIMEOUT = sum(_EXIT_POLL_DELAYS)
 
-    except Exception as e:
-        print(f"   检查进程时出错: {e}")
+# pidfd_open 的非阻塞标志（Python 3.12+ 才导出常量）
+_PIDFD_NONBLOCK = getattr(os, 'PIDFD_NONBLOCK', 0)
 
 
-def launch_with_inspect():
-    """带 Inspector 端口启动"""
-    print("\n" + "=" * 60)
-    print("🚀 启动 Trae CN (带调试端口)")
-    print("=" * 60)
+# posix_spawn 的文件操作：把子进程的 stdout/stderr 重定向到 /dev/null
+_DEVNULL_FILE_ACTIONS = [
+    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+]
 
-    cmd = [
-        'open',
-        '-n',
-        TRAE_APP_PATH,
-        '--args',
-        f'--inspect={DEBUG_PORT}',
-        f'--remote-debugging-port={REMOTE_DEBUG_PORT}',
-        '--enable-logging',
-        '--v=1'
-    ]
 
-    print(f"执行命令: {' '.join(cmd)}")
+def _spawn(cmd):
+    """
+    用 posix_spawn 启动子进程并丢弃其输出
 
-    try:
-        subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-
-        print(f"\n✅ Trae CN 已启动")
-        print(f"   调试端口: {DEBUG_PORT}")
-        print(f"   远程调试端口: {REMOTE_DEBUG_PORT}")
-        print(f"\n💡 提示:")
-        print(f"   - 在 Chrome 中访问: chrome://inspect")
-        print(f"   - 点击 'Configure' 添加: localhost:{DEBUG_PORT}")
-        print(f"   - 按 Cmd+Option+I 打开开发者工具")
-
-        # 等待启动
-        time.sleep(3)
-        return True
+    跳过 subprocess 在 fork/exec 之间逐个关闭文件描述符的开销；
+    子进程在后台线程中回收，避免留下僵尸进程
 
-    except Exception as e:
-        print(f"❌ 启动失败: {e}")
-        return False
+    Args:
+        cmd: 命令参数列表
 
+    Returns:
+        int: 子进程 PID
+    """
+    path = shutil.which(cmd[0])
+    if path is None:
+        raise FileNotFoundError(f"找不到命令: {cmd[0]}")
 
-def launch_with_devtools_open():
-    """启动并自动打开开发者工具"""
-    print("\n" + "=" * 60)
-    print("🚀 启动 Trae CN (自动打开开发者工具)")
-    print("=" * 60)
+    pid = os.posix_spawn(path, cmd, os.environ, file_actions=_DEVNULL_FILE_ACTIONS)
+    asyncio.get_running_loop().run_in_executor(None, os.waitpid, pid, 0)
+    return pid
 
-    cmd = [
-        'open',
-        '-n',
-        TRAE_APP_PATH,
-        '--args',
-        '--inspect',
-        '--dev',
-        '--open-devtools'
-    ]
 
-    print(f"执行命令: {' '.join(cmd)}")
+async def _send_sigterm(pid):
+    """
+    向指定进程发送 SIGTERM
 
+    Args:
+        pid: 进程 ID
+    """
+    print(f"   关闭进程 {pid}...")
     try:
-        subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        os.kill(pid, signal.SIGTERM)
+    except OSError:
+        pass
+
+
+def _is_alive(pid):
+    """
+    判断进程是否仍存在（发送 0 号信号，不会真正投递）
 
-        print(f"\n✅ Trae CN 已启动")
-        print(f"   开发者工具应该会自动打开")
-        print(f"   如果没有打开，按 Cmd+Option+I")
+    Args:
+        pid: 进程 ID
 
-        time.sleep(3)
+    Returns:
+        bool: 进程是否存在
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
         return True
+    return True
+
+
+def _group_members(pgid):
+    """
+    列出进程组中的所有进程
+
+    Args:
+        pgid: 进程组 ID
+
+    Returns:
+        set: 组内进程 ID 集合；当前平台无法枚举时返回 None
+    """
+    if sys.platform.startswith('linux'):
+        members = set()
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                pid = int(entry.name)
+                try:
+                    if os.getpgid(pid) == pgid:
+                        members.add(pid)
+                except OSError:
+                    continue
+        return members
+
+    if sys.platform == 'darwin':
+        try:
+            libproc = ctypes.CDLL(_LIBPROC_PATH)
+        except OSError:
+            return None
+        size = libproc.proc_listpids(_PROC_PGRP_ONLY, pgid, None, 0)
+        if size < 0:
+            return None
+        buf = (ctypes.c_int * (size // ctypes.sizeof(ctypes.c_int) + 64))()
+        size = libproc.proc_listpids(_PROC_PGRP_ONLY, pgid, buf, ctypes.sizeof(buf))
+        return {pid for pid in buf[:size // ctypes.sizeof(ctypes.c_int)] if pid > 0}
+
+    return None
+
+
+async def _terminate(pids):
+    """
+    终止一组进程：进程组恰好只包含这些进程时用一次 killpg，否则逐个发送
+
+    同组的其他进程（shell 作业、启动包装脚本等）不能被连带终止
+
+    Args:
+        pids: 进程 ID 列表
+    """
+    try:
+        pgids = {os.getpgid(pid) for pid in pids}
+    except OSError:
+        pgids = set()
+
+    if (
+        len(pgids) == 1
+        and os.getpgrp() not in pgids
+        and _group_members(next(iter(pgids))) == set(pids)
+    ):
+        pgid = pgids.pop()
+        print(f"   关闭进程组 {pgid} ({len(pids)} 个进程)...")
+        try:
+            os.killpg(pgid, signal.SIGTERM)
+            return
+        except OSError:
+            pass
+
+    await asyncio.gather(*[_send_sigterm(pid) for pid in pids])
+
+
+async def _wait_for_exit_pidfd(pids, timeout):
+    """
+    Linux：为每个进程打开 pidfd 并注册到事件循环，进程退出时 pidfd 变为可读
+
+    Args:
+        pids: 进程 ID 列表
+        timeout: 最长等待时间（秒）
+
+    Returns:
+        bool: 是否全部退出
+
+    Raises:
+        OSError: 内核不支持 pidfd_open 等情况
+    """
+    loop = asyncio.get_running_loop()
+    fds = []
+    waiters = []
+
+    def on_exit(fd, fut):
+        loop.remove_reader(fd)
+        if not fut.done():
+            fut.set_result(None)
+
+    try:
+        for pid in pids:
+            try:
+                fd = os.pidfd_open(pid, _PIDFD_NONBLOCK)
+            except ProcessLookupError:
+                continue
+            fds.append(fd)
+            fut = loop.create_future()
+            loop.add_reader(fd, on_exit, fd, fut)
+            waiters.append(fut)
+
+        if not waiters:
+            return True
+        _, pending = await asyncio.wait(waiters, timeout=timeout)
+        return not pending
+    finally:
+        for fd in fds:
+            loop.remove_reader(fd)
+            os.close(fd)
+
+
+async def _wait_for_exit(pids):
+    """
+    等待进程退出，最长约 1 秒
+
+    支持 pidfd 时由事件循环在进程退出时唤醒，否则以指数退避轮询
+
+    Args:
+        pids: 进程 ID 列表
+
+    Returns:
+        bool: 是否全部退出
+    """
+    if hasattr(os, 'pidfd_open'):
+        try:
+            return await _wait_for_exit_pidfd(pids, _EXIT_WAIT_TIMEOUT)
+        except OSError:
+            pass
+
+    for delay in _EXIT_POLL_DELAYS:
+        await asyncio.sleep(delay)
+        if not any(_is_alive(pid) for pid in pids):
+            return True
+    return False
+
+
+def _find_pids_procfs(pattern):
+    """
+    Linux：扫描 /proc/<pid>/cmdline 查找匹配的进程
+
+    Args:
+        pattern: 预编译的字节串正则
+
+    Returns:
+        list: 匹配的 PID 列表（不含本进程）
+    """
+    own_pid = os.getpid()
+    pids = []
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            if pid == own_pid:
+                continue
+            try:
+                with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                    cmdline = f.read()
+            except OSError:
+                continue
+            if pattern.search(cmdline.replace(b'\0', b' ')):
+                pids.append(pid)
+    return pids
+
+
+def _find_pids_libproc(pattern):
+    """
+    macOS：通过 libproc 的 proc_listpids/proc_pidpath 查找匹配的进程
+
+    Args:
+        pattern: 预编译的字节串正则
+
+    Returns:
+        list: 匹配的 PID 列表（不含本进程）；libproc 不可用时返回 None
+    """
+    try:
+        libproc = ctypes.CDLL(_LIBPROC_PATH)
+    except OSError:
+        return None
+
+    # 先询问所需缓冲区大小，再留出余量以容纳期间新建的进程
+    size = libproc.proc_listpids(_PROC_ALL_PIDS, 0, None, 0)
+    if size <= 0:
+        return None
+    buf = (ctypes.c_int * (size // ctypes.sizeof(ctypes.c_int) + 64))()
+    size = libproc.proc_listpids(_PROC_ALL_PIDS, 0, buf, ctypes.sizeof(buf))
+    count = size // ctypes.sizeof(ctypes.c_int)
+
+    own_pid = os.getpid()
+    path_buf = ctypes.create_string_buffer(_PROC_PIDPATHINFO_MAXSIZE)
+    pids = []
+    for pid in buf[:count]:
+        if pid <= 0 or pid == own_pid:
+            continue
+        if libproc.proc_pidpath(pid, path_buf, _PROC_PIDPATHINFO_MAXSIZE) <= 0:
+            continue
+        if pattern.search(path_buf.value):
+            pids.append(pid)
+    return pids
+
+
+async def _find_pids_pgrep(name):
+    """
+    其他平台：回退到 pgrep -f
+
+    Args:
+        name: 要匹配的进程命令行片段
+
+    Returns:
+        list: 匹配的 PID 列表
+    """
+    proc = await asyncio.create_subprocess_exec(
+        'pgrep', '-f', name,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+    out, _ = await proc.communicate()
+    if proc.returncode != 0:
+        return []
+    return [int(pid) for pid in out.decode().split()]
+
+
+async def _find_trae_pids():
+    """
+    在本进程内扫描进程表查找 Trae CN，无法直接扫描时才启动 pgrep
+
+    Returns:
+        list: 匹配的 PID 列表
+    """
+    pids = None
+    if os.path.isdir('/proc/self'):
+        pids = _find_pids_procfs(_TRAE_PROCESS_PATTERN)
+    elif sys.platform == 'darwin':
+        pids = _find_pids_libproc(_TRAE_PROCESS_PATTERN)
+
+    if pids is None:
+        pids = await _find_pids_pgrep(TRAE_PROCESS_NAME)
+    return pids
+
+
+async def kill_existing_traе():
+    """关闭已运行的 Trae CN"""
+    print("🔍 检查已运行的 Trae CN...")
+
+    try:
+        # 查找 Trae CN 进程
+        pids = await _find_trae_pids()
+
+        if pids:
+            await _terminate(pids)
+            if await _wait_for_exit(pids):
+                print("✅ 已关闭现有进程")
+            else:
+                print("⚠️  部分进程仍在退出中")
+        else:
+            print("   没有运行的 Trae CN 进程")
 
     except Exception as e:
-        print(f"❌ 启动失败: {e}")
-        return False
+        print(f"   检查进程时出错: {e}")
 
 
-def launch_simple():
-    """简单启动"""
+async def _wait_for_port(port, timeout=PORT_READY_TIMEOUT):
+    """
+    轮询本地端口，直到可以建立 TCP 连接或超时
+
+    Args:
+        port: 端口号
+        timeout: 最长等待时间（秒）
+
+    Returns:
+        bool: 端口是否在超时前就绪
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        try:
+            _, writer = await asyncio.open_connection('127.0.0.1', port)
+        except OSError:
+            await asyncio.sleep(_PORT_POLL_INTERVAL)
+            continue
+        writer.close()
+        return True
+    return False
+
+
+async def _report_port_ready(port):
+    """
+    等待调试端口就绪并打印结果
+
+    Args:
+        port: 端口号
+    """
+    if await _wait_for_port(port):
+        print(f"✅ 调试端口 {port} 已就绪")
+    else:
+        print(f"⚠️  调试端口 {port} 在 {PORT_READY_TIMEOUT:.0f} 秒内未就绪")
+
+
+class LaunchMode(NamedTuple):
+    """启动模式"""
+    title: str
+    args: Tuple[str, ...]
+    hints: Tuple[str, ...]
+    ready_port: Optional[int] = None
+
+
+LAUNCH_MODES: Dict[str, LaunchMode] = {
+    'simple': LaunchMode(
+        title="🚀 启动 Trae CN",
+        args=(),
+        hints=("💡 按 Cmd+Option+I 打开开发者工具",)
+    ),
+    'inspect': LaunchMode(
+        title="🚀 启动 Trae CN (带调试端口)",
+        args=(
+            f'--inspect={DEBUG_PORT}',
+            f'--remote-debugging-port={REMOTE_DEBUG_PORT}',
+            '--enable-logging',
+            '--v=1'
+        ),
+        hints=(
+            f"   调试端口: {DEBUG_PORT}",
+            f"   远程调试端口: {REMOTE_DEBUG_PORT}",
+            "\n💡 提示:",
+            "   - 在 Chrome 中访问: chrome://inspect",
+            f"   - 点击 'Configure' 添加: localhost:{DEBUG_PORT}",
+            "   - 按 Cmd+Option+I 打开开发者工具"
+        ),
+        ready_port=DEBUG_PORT
+    ),
+    'devtools': LaunchMode(
+        title="🚀 启动 Trae CN (自动打开开发者工具)",
+        args=('--inspect', '--dev', '--open-devtools'),
+        hints=(
+            "   开发者工具应该会自动打开",
+            "   如果没有打开，按 Cmd+Option+I"
+        ),
+        ready_port=NODE_INSPECT_DEFAULT_PORT
+    ),
+}
+
+
+async def _launch(mode):
+    """
+    按 LAUNCH_MODES 中的配置启动 Trae CN，并在需要时等待调试端口就绪
+
+    Args:
+        mode: 启动模式名称（simple/inspect/devtools）
+
+    Returns:
+        bool: 是否启动成功
+    """
+    spec = LAUNCH_MODES[mode]
     print("\n" + "=" * 60)
-    print("🚀 启动 Trae CN")
+    print(spec.title)
     print("=" * 60)
 
     cmd = ['open', '-n', TRAE_APP_PATH]
+    if spec.args:
+        cmd += ['--args', *spec.args]
 
-    try:
-        subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        print("✅ Trae CN 已启动")
-        print("💡 按 Cmd+Option+I 打开开发者工具")
-        time.sleep(3)
-        return True
+    print(f"执行命令: {' '.join(cmd)}")
 
+    try:
+        _spawn(cmd)
     except Exception as e:
         print(f"❌ 启动失败: {e}")
         return False
 
+    print("\n✅ Trae CN 已启动")
+    for hint in spec.hints:
+        print(hint)
+
+    if spec.ready_port is not None:
+        await _report_port_ready(spec.ready_port)
+    return True
+
 
 def create_traе_script():
     """创建可执行的 Trae CN 启动脚本"""
@@ -197,33 +549,93 @@ echo "已启动！按 Cmd+Option+I 打开开发者工具"
         print(f"创建脚本失败: {e}")
 
 
-def check_node_debugger():
+async def check_node_debugger():
     """检查是否有 Node.js 调试器可用"""
     print("\n📦 检查调试工具...")
 
+    # 检查 Node.js：一次 node --version 即可同时确认是否安装并取得版本
     try:
-        # 检查 Node.js
-        result = subprocess.run(['which', 'node'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("   ✅ Node.js 已安装")
-            print(f"   版本: {subprocess.run(['node', '--version'], capture_output=True, text=True).stdout.strip()}")
+        proc = await asyncio.create_subprocess_exec(
+            'node', '--version',
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        out, _ = await proc.communicate()
+    except OSError:
+        print("   ❌ Node.js 未安装")
+        return
 
-            # 安装 ndb（Node.js 调试器）
-            print("\n💡 建议安装 ndb 以获得更好的调试体验:")
-            print("   npm install -g ndb")
+    if proc.returncode != 0:
+        print("   ❌ Node.js 未安装")
+        return
 
-    except Exception as e:
-        print(f"   ❌ Node.js 未安装")
+    print("   ✅ Node.js 已安装")
+    print(f"   版本: {out.decode().strip()}")
 
+    # 安装 ndb（Node.js 调试器）
+    print("\n💡 建议安装 ndb 以获得更好的调试体验:")
+    print("   npm install -g ndb")
+
+
+async def _relaunch(mode):
+    """
+    关闭已运行的 Trae CN 后按指定模式重新启动
+
+    Args:
+        mode: 启动模式名称
+
+    Returns:
+        bool: 是否启动成功
+    """
+    await kill_existing_traе()
+    return await _launch(mode)
 
-def main():
-    """主函数"""
-    print("=" * 60)
-    print("Trae CN 启动器")
-    print("=" * 60)
-    print(f"时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-    # 选项
+async def _run_until_stopped(coro):
+    """
+    运行协程，收到 SIGINT/SIGTERM 时取消它（包括其中的端口探测、退出轮询等等待）
+
+    Args:
+        coro: 要运行的协程
+
+    Returns:
+        协程的返回值；被信号中断时返回 None
+    """
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    task = asyncio.ensure_future(coro)
+    stopper = asyncio.ensure_future(stop.wait())
+    try:
+        await asyncio.wait({task, stopper}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(sig)
+
+    if task.done():
+        stopper.cancel()
+        return task.result()
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    print("\n⚠️  收到中断信号，已取消当前操作")
+    return None
+
+
+# 菜单编号到命令行模式的映射
+_MENU_MODES = {'1': 'simple', '2': 'inspect', '3': 'devtools', '4': 'script', '5': 'check'}
+CLI_MODES = tuple(_MENU_MODES.values())
+
+
+def _interactive_prompt():
+    """
+    交互式选择启动模式（仅在未指定 --mode 且 stdin 为终端时使用）
+
+    Returns:
+        str: 模式名称；输入无效时返回 None
+    """
     print("\n请选择启动模式:")
     print("  1. 简单启动 (按 Cmd+Option+I 打开开发者工具)")
     print("  2. 调试模式 (--inspect=9222)")
@@ -232,20 +644,41 @@ def main():
     print("  5. 检查调试工具")
 
     choice = input("\n请选择 [1-5]: ").strip()
-
-    if choice == '1':
-        kill_existing_traе()
-        launch_simple()
-    elif choice == '2':
-        kill_existing_traе()
-        launch_with_inspect()
-    elif choice == '3':
-        kill_existing_traе()
-        launch_with_devtools_open()
-    elif choice == '4':
+    return _MENU_MODES.get(choice)
+
+
+def _parse_args(argv=None):
+    """
+    解析命令行参数
+
+    Args:
+        argv: 参数列表，默认使用 sys.argv
+
+    Returns:
+        argparse.Namespace: 解析结果
+    """
+    parser = argparse.ArgumentParser(description="Trae CN 启动器")
+    parser.add_argument(
+        '--mode',
+        choices=CLI_MODES,
+        help="启动模式；省略时在终端中交互选择，非终端环境默认 simple"
+    )
+    return parser.parse_args(argv)
+
+
+async def main(mode):
+    """
+    主函数：按模式分发
+
+    Args:
+        mode: 模式名称（simple/inspect/devtools/script/check），None 表示无效选择
+    """
+    if mode in LAUNCH_MODES:
+        await _run_until_stopped(_relaunch(mode))
+    elif mode == 'script':
         create_traе_script()
-    elif choice == '5':
-        check_node_debugger()
+    elif mode == 'check':
+        await _run_until_stopped(check_node_debugger())
     else:
         print("无效选择")
 
@@ -253,4 +686,17 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    args = _parse_args()
+
+    print("=" * 60)
+    print("Trae CN 启动器")
+    print("=" * 60)
+    print(f"时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    mode = args.mode
+    if mode is None:
+        mode = _interactive_prompt() if sys.stdin.isatty() else 'simple'
+
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(main(mode))
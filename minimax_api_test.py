@@ -9,6 +9,10 @@ MiniMax-M2.1 API 测试脚本
 2. 设置环境变量: export MINIMAX_API_KEY="your_api_key"
 3. 运行脚本: python3 minimax_api_test.py
 
+客户端基于 httpx 实现（安装 h2 后启用 HTTP/2），所有 API 方法均为协程：
+    async with MiniMaxClient() as client:
+        result = await client.generate_text("你好")
+
 作者: AI Assistant
 日期: 2025-01-02
 """
@@ -17,26 +21,89 @@ import os
 import sys
 import json
 import time
-import requests
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+import asyncio
+import argparse
+import httpx
+from typing import Optional, Dict, Any, List, AsyncIterator, Awaitable, Union
+
+from minimax_config import MiniMaxConfig
+
+# h2 为可选依赖，缺失时回退到 HTTP/1.1 keep-alive
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop 为可选依赖，缺失时使用默认事件循环
+    uvloop = None
+
+
+# 连接池规模：keep-alive 连接复用可省去重复的 TLS 握手
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+_TRANSPORT_RETRIES = 2
+
+# 生成参数默认值：与之相同的请求可复用预编码的请求体前缀
+_DEFAULT_MAX_TOKENS = 4096
+_DEFAULT_TEMPERATURE = 0.7
+_MESSAGES_KEY = b',"messages":'
+
+# 非 verbose 模式下生成文本的预览长度
+_PREVIEW_CHARS = 80
+
+# Server-Sent Events 数据行前缀与流结束标记
+_SSE_DATA_PREFIX = "data:"
+_SSE_DONE = "[DONE]"
+
+# 流式请求额外携带的请求头
+_SSE_HEADERS = {"Accept": "text/event-stream"}
 
+# 标准库回退时复用的 JSON 编码器（紧凑输出，保留非 ASCII 字符）
+_json_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
 
-@dataclass
-class MiniMaxConfig:
+
+def _dumps(obj: Any) -> bytes:
     """
-    MiniMax API配置类
-    
-    Attributes:
-        api_key: MiniMax开放平台API密钥
-        base_url: API基础URL地址
-        model: 使用的模型名称
-        timeout: 请求超时时间（秒）
+    序列化为 UTF-8 编码的 JSON 字节串
+
+    优先使用 orjson，未安装时回退到标准库 json
+
+    Args:
+        obj: 待序列化对象
+
+    Returns:
+        bytes: JSON 字节串
     """
-    api_key: str
-    base_url: str = "https://api.minimax.chat/v1"
-    model: str = "MiniMax-M2.1"
-    timeout: int = 60
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _json_encoder.encode(obj).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """反序列化 JSON 字节串（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _fmt(obj: Any) -> str:
+    """缩进格式化 JSON 用于展示（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def _preview(text: str) -> str:
+    """截取生成文本的开头用于简要展示"""
+    if len(text) <= _PREVIEW_CHARS:
+        return text
+    return text[:_PREVIEW_CHARS] + "..."
 
 
 class MiniMaxAPIError(Exception):
@@ -56,20 +123,76 @@ class MiniMaxAPIError(Exception):
         super().__init__(f"API Error [{status_code}][{error_code}]: {message}")
 
 
+class ConversationState:
+    """
+    多轮对话的消息缓冲
+    
+    同时保存消息列表与其 JSON 编码（不含结尾的 "]"），每追加一条消息只序列化新增部分，
+    每轮请求无需重新编码全部历史
+    
+    Attributes:
+        messages: 消息列表
+        serialized_prefix: 已编码的消息数组前缀
+    
+    Examples:
+        >>> state = ConversationState()
+        >>> state.append("user", "你好")
+        >>> response = await client.chat_completion(state)
+        >>> state.append("assistant", response["choices"][0]["message"]["content"])
+    """
+    __slots__ = ('messages', 'serialized_prefix')
+    
+    def __init__(self, messages: Optional[list] = None):
+        """
+        初始化对话缓冲
+        
+        Args:
+            messages: 初始消息列表，每条消息包含role和content
+        """
+        self.messages = []
+        self.serialized_prefix = bytearray(b'[')
+        for message in messages or ():
+            self.append(message["role"], message["content"])
+    
+    def append(self, role: str, content: str):
+        """
+        追加一条消息
+        
+        Args:
+            role: 消息角色（system/user/assistant）
+            content: 消息内容
+        """
+        message = {"role": role, "content": content}
+        if self.messages:
+            self.serialized_prefix += b','
+        self.serialized_prefix += _dumps(message)
+        self.messages.append(message)
+    
+    def serialized(self) -> bytes:
+        """
+        获取完整的消息数组 JSON
+        
+        Returns:
+            bytes: JSON 数组字节串
+        """
+        return bytes(self.serialized_prefix + b']')
+
+
 class MiniMaxClient:
     """
     MiniMax API客户端类
     
-    用于与MiniMax开放平台进行交互，支持文本生成等操作
+    用于与MiniMax开放平台进行交互，支持文本生成等操作。
+    所有 API 方法均为协程，多个请求可在同一事件循环中并发执行
     
     Attributes:
         config: MiniMaxConfig配置对象
-        session: requests会话对象
+        headers: 默认请求头
     
     Examples:
-        >>> client = MiniMaxClient(api_key="your_api_key")
-        >>> response = client.generate_text("你好，请介绍一下你自己")
-        >>> print(response.text)
+        >>> async with MiniMaxClient(api_key="your_api_key") as client:
+        ...     response = await client.generate_text("你好，请介绍一下你自己")
+        >>> print(response["choices"][0]["message"]["content"])
     """
     
     def __init__(self, api_key: Optional[str] = None, config: Optional[MiniMaxConfig] = None):
@@ -95,18 +218,58 @@ class MiniMaxClient:
                     )
             self.config = MiniMaxConfig(api_key=api_key)
         
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "Authorization": f"Bearer {self.config.api_key}",
             "Content-Type": "application/json",
             "User-Agent": "MiniMax-Python-SDK/1.0"
-        })
+        }
+        
+        # 默认参数请求体的固定部分（去掉结尾的 "}"），请求时只需拼接 messages
+        self._default_body_prefix = _dumps({
+            "model": self.config.model,
+            "max_tokens": _DEFAULT_MAX_TOKENS,
+            "temperature": _DEFAULT_TEMPERATURE,
+            "stream": False
+        })[:-1]
+        
+        # 限制同时进行的请求数，避免大量并发请求压垮服务端、触发限流
+        self._sem = asyncio.Semaphore(self.config.max_concurrent_requests)
+        self._in_flight = 0
+        
+        # 传入自定义 transport 时，httpx 以 transport 上的 http2/limits 为准
+        self._client = httpx.AsyncClient(
+            base_url=self.config.base_url,
+            headers=self.headers,
+            timeout=self.config.timeout,
+            transport=httpx.AsyncHTTPTransport(
+                http2=h2 is not None,
+                limits=_POOL_LIMITS,
+                retries=_TRANSPORT_RETRIES
+            )
+        )
     
-    def _make_request(
+    async def __aenter__(self) -> "MiniMaxClient":
+        """异步上下文管理器进入"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """异步上下文管理器退出，关闭连接池"""
+        await self.close()
+    
+    async def close(self):
+        """关闭 HTTP 客户端及其连接池"""
+        await self._client.aclose()
+    
+    @property
+    def in_flight(self) -> int:
+        """当前正在进行（已占用并发名额）的请求数"""
+        return self._in_flight
+    
+    async def _make_request(
         self, 
         endpoint: str, 
         method: str = "GET",
-        data: Optional[Dict[str, Any]] = None
+        data: Optional[Any] = None
     ) -> Dict[str, Any]:
         """
         发送API请求的内部方法
@@ -114,62 +277,140 @@ class MiniMaxClient:
         Args:
             endpoint: API端点路径
             method: HTTP请求方法（GET/POST）
-            data: 请求数据字典
+            data: 请求数据字典，或已编码好的 JSON 字节串
         
         Returns:
             Dict: API响应数据
         
         Raises:
             MiniMaxAPIError: 当API调用失败时
-            requests.RequestException: 当网络请求失败时
+            httpx.HTTPError: 当网络请求失败或超时时
+        """
+        async with self._sem:
+            self._in_flight += 1
+            try:
+                if method.upper() == "GET":
+                    response = await self._client.get(endpoint)
+                else:
+                    body = data if isinstance(data, bytes) else _dumps(data)
+                    response = await self._client.post(endpoint, content=body)
+            finally:
+                self._in_flight -= 1
+        
+        if response.is_error:
+            _raise_api_error(response)
+        
+        return _loads(response.content)
+    
+    async def _stream_request(self, endpoint: str, body: bytes) -> AsyncIterator[Dict[str, Any]]:
         """
-        url = f"{self.config.base_url}{endpoint}"
+        发送流式请求，逐条解析 Server-Sent Events 并产出数据块
+        
+        Args:
+            endpoint: API端点路径
+            body: 已编码的 JSON 请求体
+        
+        Yields:
+            Dict: 每个 "data:" 事件解析后的数据块
         
-        try:
-            if method.upper() == "GET":
-                response = self.session.get(url, timeout=self.config.timeout)
-            else:
-                response = self.session.post(
-                    url, 
-                    json=data, 
-                    timeout=self.config.timeout
-                )
-            
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.HTTPError as e:
-            error_info = {}
+        Raises:
+            MiniMaxAPIError: 当API调用失败时
+            httpx.HTTPError: 当网络请求失败或超时时
+        """
+        async with self._sem:
+            self._in_flight += 1
             try:
-                error_info = response.json()
-            except (json.JSONDecodeError, AttributeError):
-                error_info = {"message": str(e)}
-            
-            raise MiniMaxAPIError(
-                status_code=response.status_code,
-                error_code=error_info.get("error_code", "UNKNOWN"),
-                message=error_info.get("message", str(e))
-            )
+                async with self._client.stream(
+                    "POST", endpoint, content=body, headers=_SSE_HEADERS
+                ) as response:
+                    if response.is_error:
+                        await response.aread()
+                        _raise_api_error(response)
+                    
+                    # 一个事件可以包含多行 data，遇到空行时才算结束
+                    data_lines: List[str] = []
+                    async for line in response.aiter_lines():
+                        if line.startswith(_SSE_DATA_PREFIX):
+                            data_lines.append(line[len(_SSE_DATA_PREFIX):].strip())
+                            continue
+                        if line or not data_lines:
+                            # event:/id:/注释等其他字段不需要处理
+                            continue
+                        
+                        payload = "\n".join(data_lines)
+                        data_lines.clear()
+                        if payload == _SSE_DONE:
+                            return
+                        if payload:
+                            yield _loads(payload)
+                    
+                    # 服务端可能省略最后一个事件后的空行
+                    payload = "\n".join(data_lines)
+                    if payload and payload != _SSE_DONE:
+                        yield _loads(payload)
+            finally:
+                self._in_flight -= 1
     
-    def list_models(self) -> Dict[str, Any]:
+    def _encode_body(
+        self,
+        messages: Union[list, ConversationState],
+        max_tokens: int,
+        temperature: float,
+        stream: bool
+    ) -> bytes:
+        """
+        编码生成类请求的请求体
+        
+        参数与默认值一致时复用预编码前缀；messages 为 ConversationState 时直接拼接
+        其已编码的消息数组，不再序列化历史
+        
+        Args:
+            messages: 消息列表或对话缓冲
+            max_tokens: 最大生成token数量
+            temperature: 温度参数
+            stream: 是否使用流式响应
+        
+        Returns:
+            bytes: JSON 请求体
+        """
+        if isinstance(messages, ConversationState):
+            messages_json = messages.serialized()
+        else:
+            messages_json = _dumps(messages)
+        
+        if (max_tokens == _DEFAULT_MAX_TOKENS and temperature == _DEFAULT_TEMPERATURE
+                and not stream):
+            prefix = self._default_body_prefix
+        else:
+            prefix = _dumps({
+                "model": self.config.model,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "stream": stream
+            })[:-1]
+        
+        return b''.join((prefix, _MESSAGES_KEY, messages_json, b'}'))
+    
+    async def list_models(self) -> Dict[str, Any]:
         """
         获取可用的模型列表
         
         Returns:
             Dict: 模型列表响应数据
         """
-        return self._make_request("/models", "GET")
+        return await self._make_request("/models", "GET")
     
     def generate_text(
         self,
         prompt: str,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
+        max_tokens: int = _DEFAULT_MAX_TOKENS,
+        temperature: float = _DEFAULT_TEMPERATURE,
         stream: bool = False,
-        system_prompt: Optional[str] = None
-    ) -> Dict[str, Any]:
+        system_prompt: Optional[str] = None,
+        state: Optional[ConversationState] = None
+    ) -> Union[Awaitable[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]:
         """
-        生成文本（同步调用）
+        生成文本
         
         Args:
             prompt: 用户输入的提示词
@@ -177,73 +418,124 @@ class MiniMaxClient:
             temperature: 温度参数（0-1），越高越有创造性
             stream: 是否使用流式响应
             system_prompt: 系统提示词
+            state: 可选的对话缓冲；提供时把本轮消息追加到其中并携带历史发送，
+                回复需由调用方用 state.append("assistant", ...) 记录
         
         Returns:
-            Dict: 生成的文本响应
+            stream=False 时返回可 await 的完整响应；
+            stream=True 时返回异步迭代器，调用方需用 async for 逐块消费
         
         Examples:
             >>> client = MiniMaxClient()
-            >>> result = client.generate_text("用Python写一个快速排序算法")
+            >>> result = await client.generate_text("用Python写一个快速排序算法")
             >>> print(result["choices"][0]["message"]["content"])
+            >>> async for chunk in client.generate_text("你好", stream=True):
+            ...     print(chunk["choices"][0]["delta"]["content"], end="")
         """
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-        
-        data = {
-            "model": self.config.model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "stream": stream
-        }
+        if state is not None:
+            if system_prompt and not state.messages:
+                state.append("system", system_prompt)
+            state.append("user", prompt)
+            messages = state
+        else:
+            messages = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": prompt})
         
-        return self._make_request("/text/generate", "POST", data)
+        body = self._encode_body(messages, max_tokens, temperature, stream)
+        if stream:
+            return self._stream_request("/text/generate", body)
+        return self._make_request("/text/generate", "POST", body)
     
     def chat_completion(
         self,
-        messages: list,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
+        messages: Union[list, ConversationState],
+        max_tokens: int = _DEFAULT_MAX_TOKENS,
+        temperature: float = _DEFAULT_TEMPERATURE,
         stream: bool = False
-    ) -> Dict[str, Any]:
+    ) -> Union[Awaitable[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]:
         """
         聊天补全接口（OpenAI兼容格式）
         
         Args:
-            messages: 消息列表，每条消息包含role和content
+            messages: 消息列表（每条消息包含role和content），或 ConversationState
             max_tokens: 最大生成token数量
             temperature: 温度参数
             stream: 是否使用流式响应
         
         Returns:
-            Dict: 聊天补全响应
+            stream=False 时返回可 await 的完整响应；
+            stream=True 时返回异步迭代器，调用方需用 async for 逐块消费
         
         Examples:
             >>> messages = [
             ...     {"role": "system", "content": "你是一个编程助手"},
             ...     {"role": "user", "content": "写一个Python函数计算斐波那契数列"}
             ... ]
-            >>> response = client.chat_completion(messages)
+            >>> response = await client.chat_completion(messages)
         """
-        data = {
-            "model": self.config.model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "stream": stream
-        }
-        
-        return self._make_request("/chat/completions", "POST", data)
+        body = self._encode_body(messages, max_tokens, temperature, stream)
+        if stream:
+            return self._stream_request("/chat/completions", body)
+        return self._make_request("/chat/completions", "POST", body)
+
+
+def _raise_api_error(response: httpx.Response):
+    """
+    将错误响应转换为 MiniMaxAPIError 抛出
+    
+    Args:
+        response: 状态码 >= 400 且已读取完正文的响应
+    
+    Raises:
+        MiniMaxAPIError: 总是抛出
+    """
+    try:
+        error_info = _loads(response.content)
+    except ValueError:
+        error_info = None
+    if not isinstance(error_info, dict):
+        error_info = {"message": f"{response.status_code} {response.reason_phrase}"}
+    
+    raise MiniMaxAPIError(
+        status_code=response.status_code,
+        error_code=error_info.get("error_code", "UNKNOWN"),
+        message=error_info.get("message", f"{response.status_code} {response.reason_phrase}")
+    )
+
+
+def _report_failure(label: str, error: BaseException) -> bool:
+    """
+    打印并发测试中单个请求的失败信息
+    
+    Args:
+        label: 测试名称
+        error: asyncio.gather 返回的异常对象
+    
+    Returns:
+        bool: 始终为 False，便于直接作为测试结果返回
+    """
+    if isinstance(error, MiniMaxAPIError):
+        print(f"✗ [{label}] API调用失败: {error}")
+    elif isinstance(error, httpx.HTTPError):
+        print(f"✗ [{label}] 网络请求失败: {error}")
+    else:
+        print(f"✗ [{label}] 未知错误: {error}")
+    return False
 
 
-def test_api_connection():
+async def main_tests(verbose: bool = False) -> bool:
     """
-    测试API连接和基本功能
+    并发执行模型列表、基础文本生成与 MiniMax-M2.1 代码生成测试
+    
+    三个请求互不依赖，通过 asyncio.gather 同时发出，总耗时取决于最慢的一个
+    
+    Args:
+        verbose: 是否打印完整响应；默认只打印数量与文本预览
     
     Returns:
-        bool: 测试是否成功
+        bool: 模型列表与基础文本生成测试是否成功
     """
     print("=" * 60)
     print("MiniMax API 连接测试")
@@ -251,93 +543,94 @@ def test_api_connection():
     
     try:
         client = MiniMaxClient()
-        
-        # 测试1: 列出可用模型
-        print("\n[测试1] 获取模型列表...")
-        models_response = client.list_models()
-        print(f"✓ 模型列表获取成功")
-        print(f"  可用模型: {json.dumps(models_response, ensure_ascii=False, indent=2)}")
-        
-        # 测试2: 文本生成测试
-        print("\n[测试2] 文本生成测试...")
-        test_prompt = "请用一句话介绍你自己。"
-        response = client.generate_text(test_prompt, max_tokens=100)
-        
-        if response.get("choices") and len(response["choices"]) > 0:
-            generated_text = response["choices"][0]["message"]["content"]
-            print(f"✓ 文本生成成功")
-            print(f"  输入: {test_prompt}")
-            print(f"  输出: {generated_text}")
-        else:
-            print(f"✗ 响应格式异常: {json.dumps(response, ensure_ascii=False, indent=2)}")
-            return False
-        
-        return True
-        
     except ValueError as e:
         print(f"✗ 配置错误: {e}")
         print("\n请设置环境变量: export MINIMAX_API_KEY='your_api_key'")
         print("或直接在代码中传入api_key参数")
         return False
-    except MiniMaxAPIError as e:
-        print(f"✗ API调用失败: {e}")
-        return False
-    except requests.exceptions.RequestException as e:
-        print(f"✗ 网络请求失败: {e}")
-        return False
-    except Exception as e:
-        print(f"✗ 未知错误: {e}")
-        return False
-
-
-def test_with_custom_model():
-    """
-    测试使用特定模型
-    
-    Args:
-        model_name: 要测试的模型名称
-    """
-    print("\n" + "=" * 60)
-    print("MiniMax-M2.1 专项测试")
-    print("=" * 60)
     
-    try:
-        # 使用MiniMax-M2.1模型
-        config = MiniMaxConfig(
-            api_key=os.environ.get("MINIMAX_API_KEY", ""),
-            model="MiniMax-M2.1"
-        )
-        client = MiniMaxClient(config=config)
-        
-        print(f"\n使用模型: {config.model}")
-        
-        # 代码生成测试
-        code_prompt = """请用Python写一个简单的HTTP服务器，
+    test_prompt = "请用一句话介绍你自己。"
+    code_prompt = """请用Python写一个简单的HTTP服务器，
 要求：
 1. 使用Flask框架
 2. 提供一个GET接口 /hello
 3. 返回JSON格式的问候信息
 4. 包含错误处理"""
-        
-        print("\n[代码生成测试]")
-        response = client.generate_text(
-            prompt=code_prompt,
-            max_tokens=1024,
-            temperature=0.3
+    
+    async with client:
+        models, basic, code = await asyncio.gather(
+            client.list_models(),
+            client.generate_text(test_prompt, max_tokens=100),
+            client.generate_text(code_prompt, max_tokens=1024, temperature=0.3),
+            return_exceptions=True
         )
-        
-        if response.get("choices"):
-            code_output = response["choices"][0]["message"]["content"]
-            print("✓ 代码生成成功")
+    
+    success = True
+    
+    # 测试1: 列出可用模型
+    print("\n[测试1] 获取模型列表...")
+    if isinstance(models, BaseException):
+        success = _report_failure("模型列表", models)
+    else:
+        print(f"✓ 模型列表获取成功")
+        if verbose:
+            print(f"  可用模型: {_fmt(models)}")
+        else:
+            print(f"  可用模型数: {len(models.get('data') or [])}")
+    
+    # 测试2: 文本生成测试
+    print("\n[测试2] 文本生成测试...")
+    if isinstance(basic, BaseException):
+        success = _report_failure("文本生成", basic)
+    elif basic.get("choices"):
+        print(f"✓ 文本生成成功")
+        print(f"  输入: {test_prompt}")
+        generated_text = basic['choices'][0]['message']['content']
+        print(f"  输出: {generated_text if verbose else _preview(generated_text)}")
+    else:
+        print(f"✗ 响应格式异常: {_fmt(basic)}")
+        success = False
+    
+    # 测试3: MiniMax-M2.1 代码生成测试
+    print("\n" + "=" * 60)
+    print("MiniMax-M2.1 专项测试")
+    print("=" * 60)
+    print(f"\n使用模型: {client.config.model}")
+    print("\n[代码生成测试]")
+    if isinstance(code, BaseException):
+        _report_failure("代码生成", code)
+    elif code.get("choices"):
+        print("✓ 代码生成成功")
+        code_output = code['choices'][0]['message']['content']
+        if verbose:
             print(f"\n生成的代码:\n{code_output}")
         else:
-            print(f"✗ 响应异常: {response}")
-            
-    except Exception as e:
-        print(f"✗ 测试失败: {e}")
+            print(f"  choices: {len(code['choices'])}, 预览: {_preview(code_output)}")
+    else:
+        print(f"✗ 响应异常: {code}")
+    
+    # 测试4: 流式生成，逐块打印以验证首包延迟
+    print("\n[流式生成测试]")
+    try:
+        async with MiniMaxClient() as stream_client:
+            print("  输出: ", end="", flush=True)
+            async for chunk in stream_client.generate_text(test_prompt, max_tokens=100, stream=True):
+                choices = chunk.get("choices") or [{}]
+                print(choices[0].get("delta", {}).get("content", ""), end="", flush=True)
+            print()
+        print("✓ 流式生成成功")
+    except (MiniMaxAPIError, httpx.HTTPError) as e:
+        print()
+        _report_failure("流式生成", e)
+    
+    return success
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MiniMax API 测试工具")
+    parser.add_argument("-v", "--verbose", action="store_true", help="打印完整的响应内容")
+    args = parser.parse_args()
+    
     print("\nMiniMax API 测试工具")
     print("-" * 60)
     
@@ -350,10 +643,11 @@ if __name__ == "__main__":
         sys.exit(1)
     
     # 执行测试
-    success = test_api_connection()
+    if uvloop is not None:
+        uvloop.install()
+    success = asyncio.run(main_tests(verbose=args.verbose))
     
     if success:
-        test_with_custom_model()
         print("\n" + "=" * 60)
         print("✓ 所有测试完成")
         print("=" * 60)
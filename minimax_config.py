@@ -16,15 +16,23 @@ MiniMax-M2.1 API 配置文件
 """
 
 import os
+import sys
+import functools
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+# dataclass(slots=True) 需要 Python 3.10+，更早的版本退化为普通冻结 dataclass
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class MiniMaxConfig:
     """
     MiniMax API配置类
     
+    实例不可变，如需修改请使用 dataclasses.replace(config, ...) 生成新对象
+    
     Attributes:
         api_key: MiniMax开放平台API密钥
         base_url: API基础URL地址
@@ -32,6 +40,7 @@ class MiniMaxConfig:
         timeout: 请求超时时间（秒）
         max_tokens: 默认最大token数量
         temperature: 默认温度参数
+        max_concurrent_requests: 单个客户端同时进行的最大请求数
     """
     api_key: str = ""
     base_url: str = "https://api.minimaxi.chat/v1"
@@ -39,8 +48,10 @@ class MiniMaxConfig:
     timeout: int = 60
     max_tokens: int = 4096
     temperature: float = 0.7
+    max_concurrent_requests: int = 16
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> MiniMaxConfig:
     """
     加载配置文件
@@ -49,6 +60,8 @@ def load_config() -> MiniMaxConfig:
     1. 环境变量 MINIMAX_API_KEY
     2. 当前文件中的配置
     
+    结果在进程内缓存；修改 MINIMAX_API_KEY 后需调用 load_config.cache_clear()
+    
     Returns:
         MiniMaxConfig: 配置对象
     """
@@ -64,9 +77,10 @@ def load_config() -> MiniMaxConfig:
     )
 
 
+@functools.lru_cache(maxsize=4)
 def validate_config(config: MiniMaxConfig) -> tuple[bool, str]:
     """
-    验证配置是否有效
+    验证配置是否有效（按配置对象缓存结果）
     
     Args:
         config: MiniMaxConfig配置对象
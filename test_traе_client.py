@@ -19,10 +19,13 @@ Trae CN 客户端完整测试脚本
 日期: 2025-01-02
 """
 
+import io
 import os
 import sys
 import json
 import time
+import functools
+from contextlib import redirect_stdout
 from datetime import datetime
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -39,6 +42,32 @@ from trae_client import (
 from ipc_communicator import IPCCommunicator, MockIPCCommunicator
 
 
+@functools.lru_cache(maxsize=1)
+def _token() -> str:
+    """首次调用时从存储文件提取 Token，之后所有测试共用（导入模块时不读取）"""
+    return get_token_from_storage()
+
+
+@functools.lru_cache(maxsize=1)
+def _ipc() -> IPCCommunicator:
+    """首次调用时创建所有测试共用的 IPC 通信器，避免每个测试重复初始化"""
+    return IPCCommunicator(auto_connect=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_client(token: str) -> TraeClient:
+    """
+    获取各测试共享的客户端（同一 Token 只创建一次）
+
+    Args:
+        token: 认证 Token
+
+    Returns:
+        共享的 TraeClient 实例
+    """
+    return create_client(token=token)
+
+
 class TestRunner:
     """测试运行器"""
 
@@ -59,8 +88,15 @@ class TestRunner:
         """运行单个测试"""
         self.log(f"运行测试: {test_name}")
 
+        # 测试内的输出先写入缓冲区，结束后一次性输出
+        buffer = io.StringIO()
+
         try:
-            result = test_func(*args, **kwargs)
+            try:
+                with redirect_stdout(buffer):
+                    result = test_func(*args, **kwargs)
+            finally:
+                sys.stdout.write(buffer.getvalue())
 
             if result is not False:
                 self.tests_passed += 1
@@ -116,7 +152,7 @@ def test_token_extraction():
     print("测试 1: Token 提取")
     print("=" * 60)
 
-    token = get_token_from_storage()
+    token = _token()
 
     if token:
         print(f"✅ 成功提取 Token")
@@ -146,7 +182,7 @@ def test_token_validation():
     print("测试 2: Token 验证")
     print("=" * 60)
 
-    token = get_token_from_storage()
+    token = _token()
     if not token:
         print("❌ 没有 Token 可用于验证")
         return False
@@ -170,12 +206,12 @@ def test_user_info():
     print("测试 3: 用户信息获取")
     print("=" * 60)
 
-    token = get_token_from_storage()
+    token = _token()
     if not token:
         print("❌ 没有 Token")
         return False
 
-    client = create_client(token=token)
+    client = _shared_client(token)
 
     try:
         user_info = client.icube.get_user_info()
@@ -207,12 +243,12 @@ def test_solo_qualification():
     print("测试 4: Solo 资格获取")
     print("=" * 60)
 
-    token = get_token_from_storage()
+    token = _token()
     if not token:
         print("❌ 没有 Token")
         return False
 
-    client = create_client(token=token)
+    client = _shared_client(token)
 
     try:
         qualification = client.get_solo_qualification()
@@ -239,12 +275,12 @@ def test_solo_status():
     print("测试 5: Solo 状态检查")
     print("=" * 60)
 
-    token = get_token_from_storage()
+    token = _token()
     if not token:
         print("❌ 没有 Token")
         return False
 
-    client = create_client(token=token)
+    client = _shared_client(token)
 
     status = client.check_solo_available()
 
@@ -268,7 +304,7 @@ def test_ipc_communication():
     print("尝试连接到 Trae CN...")
 
     try:
-        ipc = IPCCommunicator(auto_connect=False)
+        ipc = _ipc()
 
         if ipc.connect():
             print("✅ 成功连接到 Trae CN (IPC)")
@@ -329,12 +365,12 @@ def test_api_endpoints():
     print("测试 7: API 端点测试")
     print("=" * 60)
 
-    token = get_token_from_storage()
+    token = _token()
     if not token:
         print("❌ 没有 Token")
         return False
 
-    client = create_client(token=token)
+    client = _shared_client(token)
 
     endpoints = [
         ("/cloudide/api/v3/trae/GetUserInfo", "用户信息"),
@@ -394,7 +430,7 @@ def test_client_creation():
     print("✅ 默认客户端创建成功")
 
     # 测试带 Token 创建
-    token = get_token_from_storage()
+    token = _token()
     if token:
         client2 = create_client(token=token)
         print("✅ 带 Token 客户端创建成功")
@@ -422,12 +458,12 @@ def test_performance_report():
     print("测试 9: 性能报告")
     print("=" * 60)
 
-    token = get_token_from_storage()
+    token = _token()
     if not token:
         print("❌ 没有 Token")
         return False
 
-    client = create_client(token=token)
+    client = _shared_client(token)
 
     # 触发一些请求
     try:
@@ -30,20 +30,27 @@ Trae CN TowelTransport 协议实现
 """
 
 import os
+import re
+import copy
 import sys
 import json
 import time
 import uuid
 import socket
+import asyncio
 import struct
+import selectors
 import threading
 import logging
-from typing import Optional, Dict, Any, Callable, List
+from concurrent.futures import Future, wait, TimeoutError as FutureTimeoutError
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
-import fcntl
-import select
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库 json
+    orjson = None
 
 logging.basicConfig(
     level=logging.INFO,
@@ -51,6 +58,76 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 帧头：4 字节大端长度前缀（预编译格式串，避免每帧重新解析）
+_HDR = struct.Struct('>I')
+
+# 握手帧等待首个响应的最长时间（秒）
+_HANDSHAKE_TIMEOUT = 0.5
+
+# 创建 socket 时直接带上 close-on-exec（macOS 无此标志，Python 默认已不可继承）
+_SOCK_CLOEXEC = getattr(socket, 'SOCK_CLOEXEC', 0)
+
+# socket 收发缓冲区及单次 recv 的大小（字节）
+_SOCKET_BUFFER_SIZE = 65536
+
+# 接收缓冲区中已处理数据超过该值时才压缩（字节）
+_BUFFER_COMPACT_THRESHOLD = 32768
+
+# 单帧允许的最大长度（字节），超出视为协议错位
+_MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+# 从帧开头的原始字节中提取 trace_id，无人等待的响应无需完整解析 JSON
+# 只匹配顶层对象的第一个字段，避免误取嵌套对象里的 trace_id
+_TRACE_ID_RE = re.compile(rb'\s*\{\s*"trace_id"\s*:\s*"([0-9a-f-]+)"')
+_TRACE_ID_SCAN = 128
+
+# 标准库回退时复用的 JSON 编码器（紧凑输出，保留非 ASCII 字符）
+_json_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    序列化为 UTF-8 编码的 JSON 字节串
+
+    优先使用 orjson，未安装时回退到标准库 json
+
+    Args:
+        obj: 待序列化对象
+
+    Returns:
+        bytes: JSON 字节串
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return _json_encoder.encode(obj).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """反序列化 JSON 字节串（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _sendmsg_all(sock: socket.socket, buffers: List[bytes]):
+    """
+    通过 sendmsg 聚集写一次性发送多个缓冲区
+
+    处理部分写入，直到所有数据发送完毕
+
+    Args:
+        sock: 已连接的 socket
+        buffers: 待发送的缓冲区列表
+    """
+    views = [memoryview(buf) for buf in buffers]
+    while views:
+        sent = sock.sendmsg(views)
+        while views and sent >= len(views[0]):
+            sent -= len(views[0])
+            views.pop(0)
+        if sent:
+            views[0] = views[0][sent:]
+
 
 class TowelProtocolError(Exception):
     """TowelTransport 协议错误"""
@@ -84,6 +161,80 @@ class IPCResponse:
     trace_id: str = ""
 
 
+def _frame_trace_id(data: bytes) -> Optional[str]:
+    """从帧开头提取顶层的 trace_id（须为第一个字段），找不到时返回 None"""
+    match = _TRACE_ID_RE.match(data, 0, _TRACE_ID_SCAN)
+    return match.group(1).decode('ascii') if match is not None else None
+
+
+def _request_tail(channel_id: str, connect_session_id: str) -> bytes:
+    """
+    预先编码请求中每个会话固定不变的字段（含结尾的右花括号）
+
+    Args:
+        channel_id: 通道 ID
+        connect_session_id: 会话 ID
+
+    Returns:
+        bytes: 追加在请求可变部分之后的 JSON 片段
+    """
+    return (
+        f',"channel_id":"{channel_id}","connect_session_id":"{connect_session_id}"}}'
+    ).encode('ascii')
+
+
+def _encode_request(
+    service: str,
+    method: str,
+    params: Optional[dict],
+    req_tail: bytes
+) -> Tuple[str, bytes]:
+    """
+    构建并编码一个请求
+
+    只序列化每次都会变化的字段，再拼接会话固定的尾部
+
+    Args:
+        service: 服务名
+        method: 方法名
+        params: 参数
+        req_tail: _request_tail() 生成的固定尾部
+
+    Returns:
+        tuple: (trace_id, 编码后的 JSON)
+    """
+    # trace_id 同时作为请求 ID；只在进程内作字典键，8 字节随机数已足够
+    trace_id = os.urandom(8).hex()
+
+    request = {
+        'id': trace_id,
+        'service': service,
+        'method': method,
+        'params': params or {},
+        'trace_id': trace_id,
+        'timestamp': time.time()
+    }
+
+    logger.info(f"📤 {service}.{method} (trace: {trace_id[:8]}...)")
+    return trace_id, _dumps(request)[:-1] + req_tail
+
+
+def _to_response(result: Tuple[dict, int], trace_id: str) -> IPCResponse:
+    """
+    将交付的 (响应数据, 线路字节数) 转换为 IPCResponse
+
+    response_size 直接取自长度前缀，不再重新序列化响应
+    """
+    response_data, wire_size = result
+    return IPCResponse(
+        success=response_data.get('success', True),
+        data=response_data.get('data', response_data),
+        error=response_data.get('error', ''),
+        response_size=wire_size,
+        trace_id=trace_id
+    )
+
+
 class TowelTransportClient:
     """
     Trae CN TowelTransport 协议客户端
@@ -91,6 +242,13 @@ class TowelTransportClient:
     实现完整的 TowelTransport IPC 通信协议
     """
 
+    # 幂等只读 RPC 的结果缓存时间（秒）：(service, method) -> TTL
+    CACHEABLE_RPCS: Dict[Tuple[str, str], float] = {
+        ("configuration", "get_user_configuration"): 300.0,
+        ("ckg", "is_ckg_enabled_for_non_workspace_scenario"): 60.0,
+        ("agent", "get_solo_qualification"): 60.0,
+    }
+
     def __init__(self, socket_path: str = None):
         """
         初始化客户端
@@ -109,19 +267,36 @@ class TowelTransportClient:
         self.connect_session_id: str = str(uuid.uuid4())
         self.connected = False
 
-        # 响应管理
-        self.pending_requests: Dict[str, threading.Event] = {}
-        self.responses: Dict[str, dict] = {}
-        self.trace_id_map: Dict[str, str] = {}  # trace_id -> request_id
+        # 请求中每次都相同的 channel_id / connect_session_id 部分，只编码一次
+        self._req_tail = _request_tail(self.channel_id, self.connect_session_id)
+
+        # 响应管理：trace_id -> 等待该响应的 Future
+        self._inflight: Dict[str, Future] = {}
+
+        # 只读 RPC 结果缓存：(service, method, 编码后的参数) -> (过期时间, 响应)
+        self._rpc_cache: Dict[Tuple[str, str, bytes], Tuple[float, IPCResponse]] = {}
 
         # 监听
         self.running = False
         self.listen_thread: Optional[threading.Thread] = None
 
-    def connect(self, timeout: float = 5.0) -> bool:
+        # 监听线程的 selector 及唤醒用 socketpair（disconnect 时写入以解除阻塞）
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wakeup_r: Optional[socket.socket] = None
+        self._wakeup_w: Optional[socket.socket] = None
+
+        # 握手：收到服务端任意首个消息时完成
+        self._handshake: Optional[Future] = None
+
+    def connect(self, timeout: float = 5.0, handshake: bool = False) -> bool:
         """
         连接到 Trae CN TowelTransport
 
+        Args:
+            timeout: 连接超时（秒）
+            handshake: 是否发送 __hello__ 帧并等待服务端首个响应（__hello__ 并非协议
+                中已知的方法，只用于探测连接是否可用，默认不启用）
+
         Returns:
             是否连接成功
         """
@@ -136,18 +311,28 @@ class TowelTransportClient:
             logger.info(f"   Channel ID: {self.channel_id[:8]}...")
 
             # 创建 socket
-            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM | _SOCK_CLOEXEC)
             self.socket.settimeout(timeout)
             self.socket.connect(self.socket_path)
 
-            # 设置非阻塞模式，用于实时监听
-            flags = fcntl.fcntl(self.socket.fileno(), fcntl.F_GETFL, 0)
-            fcntl.fcntl(self.socket.fileno(), fcntl.F_SETFL, flags | os.O_NONBLOCK)
+            # 增大收发缓冲区，大响应无需多次 recv；系统上限不足时保持默认值
+            for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+                try:
+                    self.socket.setsockopt(socket.SOL_SOCKET, option, _SOCKET_BUFFER_SIZE)
+                except OSError as e:
+                    logger.debug(f"设置 socket 缓冲区失败: {e}")
 
             self.connected = True
             logger.info(f"✅ TCP 连接成功")
 
+            # 监听线程通过 selector 同时等待数据和唤醒信号，空闲时不产生系统调用
+            self._wakeup_r, self._wakeup_w = socket.socketpair()
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.socket, selectors.EVENT_READ)
+            self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+
             # 启动监听
+            self._handshake = Future() if handshake else None
             self.running = True
             self.listen_thread = threading.Thread(target=self._listen_loop, daemon=True)
             self.listen_thread.start()
@@ -156,8 +341,10 @@ class TowelTransportClient:
             logger.info(f"   Channel ID: {self.channel_id}")
             logger.info(f"   Session ID: {self.connect_session_id[:8]}...")
 
-            # 等待一下让握手完成
-            time.sleep(0.5)
+            if handshake and not self._wait_handshake():
+                # 握手帧发送失败说明连接不可用，撤销已发布的连接状态
+                self.disconnect()
+                return False
 
             return True
 
@@ -168,74 +355,140 @@ class TowelTransportClient:
             logger.error(f"连接失败: {e}")
             return False
 
+    def _wait_handshake(self) -> bool:
+        """
+        发送 __hello__ 帧，并在收到首个响应或超时后返回
+
+        Returns:
+            握手帧是否发送成功（响应超时不视为失败）
+        """
+        payload = _dumps({'method': '__hello__'})
+        try:
+            _sendmsg_all(self.socket, [_HDR.pack(len(payload)), payload])
+        except OSError as e:
+            logger.error(f"握手失败: {e}")
+            return False
+
+        try:
+            self._handshake.result(timeout=_HANDSHAKE_TIMEOUT)
+            logger.info("🤝 握手完成")
+        except FutureTimeoutError:
+            logger.warning("⚠️ 握手未在超时内得到响应，继续使用连接")
+        return True
+
     def _listen_loop(self):
         """监听来自 Trae CN 的响应"""
-        buffer = b''
-        max_buffer_size = 65536
+        # 接收缓冲区：head 之前为已处理的数据，只前移游标不切片复制
+        buf = bytearray()
+        head = 0
 
-        while self.running and self.socket:
-            try:
-                # 使用 select 等待数据
-                ready = select.select([self.socket], [], [], 0.1)
-
-                if not ready[0]:
-                    continue
+        # 取本地引用，重新连接时不会影响本线程的清理
+        selector = self._selector
+        wakeup, wakeup_w = self._wakeup_r, self._wakeup_w
 
+        try:
+            while self.running and self.socket:
                 try:
-                    chunk = self.socket.recv(4096)
-                except BlockingIOError:
-                    continue
-
-                if not chunk:
-                    logger.warning("连接已关闭")
-                    self.connected = False
-                    break
+                    ready = selector.select()
+                    if any(key.fileobj is wakeup for key, _ in ready):
+                        break
 
-                buffer += chunk
+                    chunk = self.socket.recv(_SOCKET_BUFFER_SIZE)
 
-                # 处理缓冲区
-                while len(buffer) >= 4:
-                    # 尝试解析长度前缀
-                    try:
-                        length = struct.unpack('>I', buffer[:4])[0]
-                    except struct.error:
-                        # 不是有效的长度前缀，清除缓冲区
-                        buffer = b''
+                    if not chunk:
+                        logger.warning("连接已关闭")
+                        self.connected = False
                         break
 
-                    if len(buffer) < 4 + length:
-                        # 等待更多数据
-                        if len(buffer) > max_buffer_size:
-                            logger.warning("缓冲区过大，清除")
-                            buffer = b''
-                        break
+                    buf.extend(chunk)
+
+                    # 处理缓冲区
+                    while len(buf) - head >= 4:
+                        (length,) = _HDR.unpack_from(buf, head)
+
+                        if length > _MAX_FRAME_SIZE:
+                            # 不是有效的长度前缀，清除缓冲区
+                            logger.warning(f"帧长度异常 ({length} 字节)，清除缓冲区")
+                            buf.clear()
+                            head = 0
+                            break
+
+                        if len(buf) - head < 4 + length:
+                            # 等待更多数据
+                            break
+
+                        # 提取消息（仅复制一次）
+                        message_data = bytes(buf[head + 4:head + 4 + length])
+                        head += 4 + length
+
+                        try:
+                            self._dispatch_frame(message_data, length)
+                        except ValueError:
+                            logger.debug(f"无效 JSON: {message_data[:100]}")
+                        except Exception as e:
+                            logger.debug(f"处理消息错误: {e}")
+
+                    # 已处理的数据累积较多时再压缩缓冲区
+                    if head > _BUFFER_COMPACT_THRESHOLD or head == len(buf):
+                        del buf[:head]
+                        head = 0
+
+                except Exception as e:
+                    if self.running:
+                        logger.error(f"监听错误: {e}")
+                    break
+        finally:
+            selector.close()
+            wakeup.close()
+            wakeup_w.close()
+            if self._wakeup_w is wakeup_w:
+                self._wakeup_w = None
+                self.connected = False
+                # 连接结束后不会再有响应，立即让等待中的请求失败
+                pending, self._inflight = self._inflight, {}
+                for future in pending.values():
+                    if not future.done():
+                        future.set_exception(TowelProtocolError("连接已关闭"))
+
+    def _dispatch_frame(self, data: bytes, wire_size: int):
+        """
+        分发一帧原始数据
 
-                    # 提取消息
-                    message_data = buffer[4:4+length]
-                    buffer = buffer[4+length:]
+        先从帧开头提取 trace_id，是没有对应等待者的响应时直接丢弃，不解析 JSON；
+        提取不到 trace_id 的帧（如通知）总是完整处理
 
-                    try:
-                        message = json.loads(message_data.decode('utf-8'))
-                        self._handle_message(message)
-                    except json.JSONDecodeError:
-                        logger.debug(f"无效 JSON: {message_data[:100]}")
-                    except Exception as e:
-                        logger.debug(f"处理消息错误: {e}")
+        Args:
+            data: 帧内容（JSON 字节串）
+            wire_size: 帧长度（长度前缀中的值）
+        """
+        handshake = self._handshake
+        if handshake is None or handshake.done():
+            trace_id = _frame_trace_id(data)
+            if trace_id is not None and trace_id not in self._inflight:
+                logger.debug(f"📭 跳过无人等待的响应 ({wire_size} 字节)")
+                return
 
-            except Exception as e:
-                if self.running:
-                    logger.error(f"监听错误: {e}")
-                break
+        self._handle_message(_loads(data), wire_size)
+
+    def _handle_message(self, message: dict, wire_size: int = 0):
+        """
+        处理接收到的消息
+
+        Args:
+            message: 解析后的消息
+            wire_size: 消息在线路上的字节数（长度前缀中的值）
+        """
+        handshake = self._handshake
+        if handshake is not None and not handshake.done():
+            handshake.set_result(message)
 
-    def _handle_message(self, message: dict):
-        """处理接收到的消息"""
         # 查找对应的请求
         trace_id = message.get('trace_id', '')
-        request_id = self.trace_id_map.get(trace_id)
+        future = self._inflight.get(trace_id)
 
-        if request_id and request_id in self.pending_requests:
-            self.responses[request_id] = message
-            self.pending_requests[request_id].set()
+        if future is not None:
+            if not future.done():
+                future.set_result((message, wire_size))
             logger.debug(f"📥 收到响应: trace_id={trace_id[:8]}...")
             return
 
@@ -243,6 +496,30 @@ class TowelTransportClient:
         if message.get('type') == 'notification':
             logger.info(f"📬 通知: {message.get('method', 'unknown')}")
 
+    def _prepare_request(self, service: str, method: str, params: dict = None):
+        """
+        构建请求并登记等待响应所需的映射
+
+        在发送之前登记，避免响应先于登记到达而丢失
+
+        Args:
+            service: 服务名
+            method: 方法名
+            params: 参数
+
+        Returns:
+            tuple: (trace_id, 等待响应的 Future, 编码后的 JSON)
+        """
+        trace_id, payload = _encode_request(
+            service, method, params, self._req_tail
+        )
+
+        # 登记等待响应的 Future
+        future = Future()
+        self._inflight[trace_id] = future
+
+        return trace_id, future, payload
+
     def send_request(
         self,
         service: str,
@@ -265,72 +542,183 @@ class TowelTransportClient:
         if not self.connected:
             raise TowelProtocolError("未连接到 Trae CN")
 
-        # 生成请求 ID 和 trace_id
-        request_id = str(uuid.uuid4())
-        trace_id = str(uuid.uuid4())
-
-        # 构建请求
-        request = {
-            'id': request_id,
-            'service': service,
-            'method': method,
-            'params': params or {},
-            'channel_id': self.channel_id,
-            'connect_session_id': self.connect_session_id,
-            'trace_id': trace_id,
-            'timestamp': time.time()
-        }
+        # 幂等只读 RPC 命中缓存时直接返回，跳过 IPC 往返
+        cache_key, ttl, cached = self._lookup_cache(service, method, params)
+        if cached is not None:
+            return cached
 
-        logger.info(f"📤 {service}.{method} (trace: {trace_id[:8]}...)")
+        trace_id, future, payload = self._prepare_request(service, method, params)
+
+        try:
+            # 发送请求：4 字节长度前缀与 JSON 通过一次 sendmsg 聚集写出，不再拼接
+            try:
+                _sendmsg_all(self.socket, [_HDR.pack(len(payload)), payload])
+            except Exception as e:
+                raise TowelProtocolError(f"发送失败: {e}")
+
+            # 等待响应
+            try:
+                result = future.result(timeout)
+            except FutureTimeoutError:
+                raise TowelProtocolError(f"请求超时: {service}.{method}")
+        finally:
+            self._inflight.pop(trace_id, None)
+
+        # 解析响应
+        response = _to_response(result, trace_id)
+        if ttl is not None and response.success:
+            self._cache_response(cache_key, ttl, response)
+        return response
 
-        # 映射 trace_id
-        self.trace_id_map[trace_id] = request_id
+    def send_event(self, service: str, method: str, params: dict = None) -> str:
+        """
+        发送不需要响应的事件：不登记 Future，写出后立即返回
 
-        # 发送请求
-        content = json.dumps(request, ensure_ascii=False)
-        content_bytes = content.encode('utf-8')
+        Args:
+            service: 服务名
+            method: 方法名
+            params: 参数
 
-        # 添加 4 字节长度前缀
-        header = struct.pack('>I', len(content_bytes))
-        message = header + content_bytes
+        Returns:
+            str: 事件的 trace_id
+        """
+        if not self.connected:
+            raise TowelProtocolError("未连接到 Trae CN")
 
+        trace_id, payload = _encode_request(service, method, params, self._req_tail)
         try:
-            self.socket.sendall(message)
+            _sendmsg_all(self.socket, [_HDR.pack(len(payload)), payload])
         except Exception as e:
-            del self.trace_id_map[trace_id]
             raise TowelProtocolError(f"发送失败: {e}")
+        return trace_id
 
-        # 等待响应
-        event = threading.Event()
-        self.pending_requests[request_id] = event
+    def _lookup_cache(self, service: str, method: str, params: Optional[dict]):
+        """
+        查找只读 RPC 的缓存结果
 
-        if not event.wait(timeout):
-            del self.pending_requests[request_id]
-            del self.trace_id_map[trace_id]
-            raise TowelProtocolError(f"请求超时: {service}.{method}")
+        Args:
+            service: 服务名
+            method: 方法名
+            params: 参数
 
-        # 获取响应
-        response_data = self.responses.pop(request_id, {})
-        del self.pending_requests[request_id]
-        del self.trace_id_map[trace_id]
+        Returns:
+            tuple: (缓存键, TTL, 命中的响应副本)；不可缓存时缓存键和 TTL 为 None，未命中时响应为 None
+        """
+        ttl = self.CACHEABLE_RPCS.get((service, method))
+        if ttl is None:
+            return None, None, None
+
+        cache_key = (service, method, _dumps(params or {}))
+        cached = self._rpc_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            logger.debug(f"💾 缓存命中: {service}.{method}")
+            # 返回副本，调用方修改 data 不会污染缓存
+            return cache_key, ttl, copy.deepcopy(cached[1])
+        return cache_key, ttl, None
+
+    def _cache_response(self, cache_key: Tuple[str, str, bytes], ttl: float, response: IPCResponse):
+        """
+        缓存只读 RPC 成功响应的副本，并顺带清理已过期的条目
 
-        # 解析响应
-        return IPCResponse(
-            success=response_data.get('success', True),
-            data=response_data.get('data', response_data),
-            error=response_data.get('error', ''),
-            response_size=len(json.dumps(response_data)),
-            trace_id=trace_id
-        )
+        Args:
+            cache_key: (service, method, 编码后的参数)
+            ttl: 缓存时间（秒）
+            response: 响应
+        """
+        now = time.monotonic()
+        expired = [key for key, (expires, _) in self._rpc_cache.items() if expires <= now]
+        for key in expired:
+            del self._rpc_cache[key]
+        self._rpc_cache[cache_key] = (now + ttl, copy.deepcopy(response))
+
+    def clear_cache(self):
+        """清空只读 RPC 结果缓存"""
+        self._rpc_cache.clear()
+
+    def send_batch(
+        self,
+        calls: List[Tuple[str, str, Optional[dict]]],
+        timeout: float = 10.0
+    ) -> List[IPCResponse]:
+        """
+        批量发送请求：所有请求帧通过一次 sendmsg 写出，再统一等待响应
+
+        命中缓存的只读 RPC 直接使用缓存结果，不发送请求
+
+        Args:
+            calls: (service, method, params) 列表
+            timeout: 等待全部响应的总超时时间
+
+        Returns:
+            List[IPCResponse]: 与 calls 一一对应的响应；超时的请求 success=False
+        """
+        if not self.connected:
+            raise TowelProtocolError("未连接到 Trae CN")
+
+        responses: List[Optional[IPCResponse]] = []
+        prepared = []
+        buffers = []
+        for service, method, params in calls:
+            cache_key, ttl, cached = self._lookup_cache(service, method, params)
+            if cached is not None:
+                responses.append(cached)
+                continue
+
+            trace_id, future, payload = self._prepare_request(service, method, params)
+            prepared.append((len(responses), service, method, trace_id, future, cache_key, ttl))
+            responses.append(None)
+            buffers.append(_HDR.pack(len(payload)))
+            buffers.append(payload)
+
+        if not prepared:
+            return responses
+
+        try:
+            try:
+                _sendmsg_all(self.socket, buffers)
+            except Exception as e:
+                raise TowelProtocolError(f"发送失败: {e}")
+
+            wait([item[4] for item in prepared], timeout)
+        finally:
+            for item in prepared:
+                self._inflight.pop(item[3], None)
+
+        for index, service, method, trace_id, future, cache_key, ttl in prepared:
+            if future.done() and future.exception() is not None:
+                response = IPCResponse(
+                    success=False,
+                    error=str(future.exception()),
+                    trace_id=trace_id
+                )
+            elif future.done():
+                response = _to_response(future.result(), trace_id)
+                if ttl is not None and response.success:
+                    self._cache_response(cache_key, ttl, response)
+            else:
+                response = IPCResponse(
+                    success=False,
+                    error=f"请求超时: {service}.{method}",
+                    trace_id=trace_id
+                )
+            responses[index] = response
+        return responses
 
     def disconnect(self):
         """断开连接"""
         self.running = False
 
+        # 唤醒阻塞在 select 上的监听线程
+        if self._wakeup_w is not None:
+            try:
+                self._wakeup_w.send(b'\0')
+            except OSError:
+                pass
+
         if self.socket:
             try:
                 self.socket.close()
-            except:
+            except OSError:
                 pass
             self.socket = None
 
@@ -355,6 +743,15 @@ class TowelTransportClient:
         """刷新 Token"""
         return self.send_request("ckg", "refresh_token")
 
+    def ckg_refresh_token_event(self) -> str:
+        """
+        刷新 Token（事件，不等待响应）
+
+        Returns:
+            str: 事件的 trace_id
+        """
+        return self.send_event("ckg", "refresh_token")
+
     def ckg_is_enabled(self) -> IPCResponse:
         """检查 CKG 是否启用"""
         return self.send_request("ckg", "is_ckg_enabled_for_non_workspace_scenario")
@@ -381,6 +778,234 @@ class TowelTransportClient:
         return self.send_request("agent", "get_solo_qualification")
 
 
+class AsyncTowelTransportClient:
+    """
+    asyncio 版 TowelTransport 协议客户端
+
+    读取由事件循环中的协程完成，不占用监听线程；
+    同一事件循环可以同时驱动多个连接
+    """
+
+    def __init__(self, socket_path: str = None):
+        """
+        初始化客户端
+
+        Args:
+            socket_path: Unix Domain Socket 路径
+        """
+        if socket_path is None:
+            socket_path = os.path.expanduser(
+                "~/Library/Application Support/Trae CN/1.10-main.sock"
+            )
+
+        self.socket_path = socket_path
+        self.channel_id: str = str(uuid.uuid4())
+        self.connect_session_id: str = str(uuid.uuid4())
+        self.connected = False
+
+        # 请求中每次都相同的 channel_id / connect_session_id 部分，只编码一次
+        self._req_tail = _request_tail(self.channel_id, self.connect_session_id)
+
+        self._stream_reader: Optional[asyncio.StreamReader] = None
+        self._stream_writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+
+        # 响应管理：trace_id -> 等待该响应的 asyncio.Future
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def __aenter__(self):
+        if not await self.connect():
+            raise TowelProtocolError(f"无法连接到 {self.socket_path}")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.disconnect()
+
+    async def connect(self, timeout: float = 5.0) -> bool:
+        """
+        连接到 Trae CN TowelTransport
+
+        Args:
+            timeout: 连接超时（秒）
+
+        Returns:
+            是否连接成功
+        """
+        if not os.path.exists(self.socket_path):
+            logger.error(f"Socket 不存在: {self.socket_path}")
+            return False
+
+        try:
+            self._stream_reader, self._stream_writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(self.socket_path), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.error("连接超时")
+            return False
+        except OSError as e:
+            logger.error(f"连接失败: {e}")
+            return False
+
+        self.connected = True
+        self._reader_task = asyncio.get_running_loop().create_task(self._reader())
+
+        logger.info(f"✅ TowelTransport 连接成功 (asyncio)")
+        logger.info(f"   Channel ID: {self.channel_id}")
+        return True
+
+    async def _reader(self):
+        """按长度前缀逐帧读取响应，并交付给等待中的 Future"""
+        reader = self._stream_reader
+        try:
+            while True:
+                header = await reader.readexactly(4)
+                (length,) = _HDR.unpack(header)
+                if length > _MAX_FRAME_SIZE:
+                    # 流式读取无法跳过错位的数据，直接关闭连接
+                    logger.warning(f"帧长度异常 ({length} 字节)，关闭连接")
+                    self._stream_writer.close()
+                    break
+                data = await reader.readexactly(length)
+
+                try:
+                    self._dispatch_frame(data, length)
+                except ValueError:
+                    logger.debug(f"无效 JSON: {data[:100]}")
+                except Exception as e:
+                    logger.debug(f"处理消息错误: {e}")
+
+        except asyncio.IncompleteReadError:
+            logger.warning("连接已关闭")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"监听错误: {e}")
+        finally:
+            self.connected = False
+            # 连接断开后不会再有响应，让等待者立即失败
+            for future in self._inflight.values():
+                if not future.done():
+                    future.set_exception(TowelProtocolError("连接已关闭"))
+
+    def _dispatch_frame(self, data: bytes, wire_size: int):
+        """
+        分发一帧原始数据，是没有对应等待者的响应时不解析 JSON
+
+        Args:
+            data: 帧内容（JSON 字节串）
+            wire_size: 帧长度（长度前缀中的值）
+        """
+        trace_id = _frame_trace_id(data)
+        if trace_id is not None and trace_id not in self._inflight:
+            logger.debug(f"📭 跳过无人等待的响应 ({wire_size} 字节)")
+            return
+
+        message = _loads(data)
+        future = self._inflight.get(message.get('trace_id', ''))
+        if future is not None:
+            if not future.done():
+                future.set_result((message, wire_size))
+            return
+
+        if message.get('type') == 'notification':
+            logger.info(f"📬 通知: {message.get('method', 'unknown')}")
+
+    async def send_request(
+        self,
+        service: str,
+        method: str,
+        params: dict = None,
+        timeout: float = 10.0
+    ) -> IPCResponse:
+        """
+        发送请求并等待响应
+
+        Args:
+            service: 服务名 (ckg, project, configuration, chat, agent)
+            method: 方法名
+            params: 参数
+            timeout: 超时时间
+
+        Returns:
+            IPCResponse: 响应
+        """
+        if not self.connected:
+            raise TowelProtocolError("未连接到 Trae CN")
+
+        trace_id, payload = _encode_request(
+            service, method, params, self._req_tail
+        )
+
+        # 在发送之前登记，避免响应先于登记到达而丢失
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[trace_id] = future
+
+        try:
+            try:
+                self._stream_writer.writelines([_HDR.pack(len(payload)), payload])
+                await self._stream_writer.drain()
+            except Exception as e:
+                raise TowelProtocolError(f"发送失败: {e}")
+
+            try:
+                result = await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                raise TowelProtocolError(f"请求超时: {service}.{method}")
+        finally:
+            self._inflight.pop(trace_id, None)
+
+        return _to_response(result, trace_id)
+
+    async def send_event(self, service: str, method: str, params: dict = None) -> str:
+        """
+        发送不需要响应的事件：不登记 Future，写出后立即返回
+
+        Args:
+            service: 服务名
+            method: 方法名
+            params: 参数
+
+        Returns:
+            str: 事件的 trace_id
+        """
+        if not self.connected:
+            raise TowelProtocolError("未连接到 Trae CN")
+
+        trace_id, payload = _encode_request(service, method, params, self._req_tail)
+        try:
+            self._stream_writer.writelines([_HDR.pack(len(payload)), payload])
+            await self._stream_writer.drain()
+        except Exception as e:
+            raise TowelProtocolError(f"发送失败: {e}")
+        return trace_id
+
+    async def disconnect(self):
+        """断开连接"""
+        if self._reader_task is not None:
+            task, self._reader_task = self._reader_task, None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        if self._stream_writer is not None:
+            self._stream_writer.close()
+            try:
+                await self._stream_writer.wait_closed()
+            except Exception:
+                pass
+            self._stream_writer = None
+            self._stream_reader = None
+
+        self.connected = False
+        logger.info("已断开 TowelTransport 连接")
+
+    def is_connected(self) -> bool:
+        """检查连接状态"""
+        return self.connected and self._stream_writer is not None
+
+
 def test_towel_transport():
     """测试 TowelTransport 连接"""
     print("=" * 60)
@@ -396,38 +1021,23 @@ def test_towel_transport():
     print("✅ 连接成功")
     print()
 
-    try:
-        # 测试配置获取
-        print("📋 测试 get_user_configuration...")
-        try:
-            response = client.get_user_configuration()
-            print(f"✅ 响应: {response.data}")
-        except TowelProtocolError as e:
-            print(f"⚠️  {e}")
-
-        # 测试 CKG
-        print("\n🔐 测试 ckg_setup...")
-        try:
-            response = client.ckg_setup()
-            print(f"✅ 响应: {response.data}")
-        except TowelProtocolError as e:
-            print(f"⚠️  {e}")
+    # 四个探测请求一次性批量发出
+    probes = [
+        ("📋", "get_user_configuration", ("configuration", "get_user_configuration", None)),
+        ("🔐", "ckg_setup", ("ckg", "setup", None)),
+        ("💬", "chat_get_sessions", ("chat", "get_sessions", None)),
+        ("🎯", "agent_get_solo_qualification", ("agent", "get_solo_qualification", None)),
+    ]
 
-        # 测试聊天
-        print("\n💬 测试 chat_get_sessions...")
-        try:
-            response = client.chat_get_sessions()
-            print(f"✅ 响应: {response.data}")
-        except TowelProtocolError as e:
-            print(f"⚠️  {e}")
-
-        # 测试 Solo
-        print("\n🎯 测试 agent_get_solo_qualification...")
-        try:
-            response = client.agent_get_solo_qualification()
-            print(f"✅ 响应: {response.data}")
-        except TowelProtocolError as e:
-            print(f"⚠️  {e}")
+    try:
+        responses = client.send_batch([call for _, _, call in probes])
+
+        for (icon, name, _), response in zip(probes, responses):
+            print(f"\n{icon} 测试 {name}...")
+            if response.success:
+                print(f"✅ 响应: {response.data}")
+            else:
+                print(f"⚠️  {response.error}")
 
     except Exception as e:
         print(f"❌ 测试失败: {e}")
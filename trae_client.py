@@ -18,17 +18,27 @@ import sys
 import json
 import time
 import uuid
+import secrets
+import itertools
 import socket
 import struct
 import threading
 import logging
 import hashlib
-from typing import Optional, Dict, Any, List, Callable
+import base64
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到 response.json()
+    orjson = None
 
 logging.basicConfig(
     level=logging.INFO,
@@ -36,6 +46,68 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 每个主机保持的 keep-alive 连接数
+_POOL_CONNECTIONS = 16
+_POOL_MAXSIZE = 32
+
+# 不携带 Token 的请求用于覆盖 session 中的认证头（值为 None 的请求头会被 requests 移除）
+_NO_AUTH_HEADERS = {"Authorization": None, "x-cloudide-token": None}
+
+# 失败重试：退避系数（秒）及需要重试的状态码
+_RETRY_BACKOFF = 0.5
+_RETRY_STATUS = (429, 500, 502, 503, 504)
+# POST 不是幂等的（如发送聊天消息），不自动重试
+_RETRY_METHODS = frozenset(["GET", "PUT", "DELETE"])
+
+# 请求 trace_id：进程启动时的随机前缀 + 单调递增计数（next() 在 CPython 中是原子操作）
+_TRACE_PREFIX = secrets.token_hex(4)
+_trace_counter = itertools.count()
+
+# 查询结果的缓存时间（秒）
+_USER_INFO_TTL = 300.0
+_SOLO_QUALIFICATION_TTL = 60.0
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """
+    解析 JSON 响应体
+
+    UTF-8 响应直接用 orjson 解析原始字节，不经过中间字符串；
+    未安装 orjson 或响应为其他字符集时回退到 response.json()
+
+    Args:
+        response: HTTP 响应
+
+    Returns:
+        Any: 解析后的数据
+    """
+    encoding = response.encoding
+    if orjson is not None and (encoding is None or encoding.lower() in ('utf-8', 'utf8')):
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _jwt_exp(token: str) -> Optional[float]:
+    """
+    在本地解析 JWT 的 exp 声明
+
+    Args:
+        token: 认证 Token
+
+    Returns:
+        Optional[float]: 过期时间（epoch 秒）；不是 JWT 或没有 exp 时返回 None
+    """
+    # JWT 由三段组成，不符合格式的 Token 无法在本地判断
+    if token.count('.') != 2:
+        return None
+
+    try:
+        segment = token.split('.')[1]
+        payload = json.loads(base64.urlsafe_b64decode(segment + '=' * (-len(segment) % 4)))
+        return float(payload['exp'])
+    except (ValueError, TypeError, KeyError):
+        return None
+
 
 class RequestType(Enum):
     """请求类型"""
@@ -120,6 +192,10 @@ class ChatSession:
         )
 
 
+class TraeAPIError(Exception):
+    """Trae API 错误"""
+
+
 class IPCProtocolError(Exception):
     """IPC 协议错误"""
 
@@ -231,7 +307,7 @@ class TowelTransportIPC:
         
         self.request_counter += 1
         request_id = str(self.request_counter)
-        trace_id = str(uuid.uuid4())
+        trace_id = f"{_TRACE_PREFIX}-{next(_trace_counter):x}"
         
         # 构建请求消息（尝试多种格式）
         request_formats = [
@@ -357,6 +433,9 @@ class TraeClient:
         
         self.transport = _RESTTransport(self.config)
         self.ipc: Optional[TowelTransportIPC] = None
+
+        # 查询结果缓存：键 -> (过期时间, 结果)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
         
         if use_ipc:
             self._init_ipc()
@@ -374,34 +453,58 @@ class TraeClient:
             logger.warning(f"IPC 初始化失败: {e}")
             self.ipc = None
     
+    def _cache_get(self, key: str) -> Any:
+        """读取未过期的缓存结果，没有时返回 None"""
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _cache_put(self, key: str, value: Any, ttl: float):
+        """缓存查询结果"""
+        self._cache[key] = (time.monotonic() + ttl, value)
+
+    def clear_cache(self):
+        """清空查询结果缓存（Token 变化后调用）"""
+        self._cache.clear()
+
     def authenticate(self, username: str, password: str) -> bool:
         """用户认证"""
         try:
             result = self.transport.execute_request(
                 method="POST",
                 endpoint="/auth/login",
-                data={"username": username, "password": password}
+                data={"username": username, "password": password},
+                authenticated=False
             )
             if "token" in result:
                 self.config.token = result["token"]
+                self.clear_cache()
                 return True
             return False
         except Exception as e:
             logger.error(f"认证失败: {e}")
             return False
     
+    def is_token_valid(self) -> bool:
+        """检查当前 Token 是否有效（本地解析 JWT 过期时间）"""
+        return self.transport.is_token_valid()
+
     def get_user_info(self) -> Optional[UserProfile]:
-        """获取用户信息"""
+        """获取用户信息（缓存 5 分钟）"""
+        cached = self._cache_get("user_info")
+        if cached is not None:
+            return cached
+
         try:
             result = self.transport.execute_request(
                 method="GET",
                 endpoint="/cloudide/api/v3/trae/GetUserInfo"
             )
             
-            if "Result" in result:
-                return UserProfile.from_dict(result["Result"])
-            
-            return UserProfile.from_dict(result)
+            profile = UserProfile.from_dict(result.get("Result", result))
+            self._cache_put("user_info", profile, _USER_INFO_TTL)
+            return profile
         except Exception as e:
             logger.error(f"获取用户信息失败: {e}")
             return None
@@ -412,9 +515,15 @@ class TraeClient:
         
         这是主要功能，用于检查用户是否有资格使用 Solo 功能
         
+        结果缓存 60 秒，check_solo_available 等连续调用不会重复请求
+
         Returns:
             Optional[SoloQualification]: Solo 资格信息
         """
+        cached = self._cache_get("solo_qualification")
+        if cached is not None:
+            return cached
+
         try:
             result = self.transport.execute_request(
                 method="GET",
@@ -424,7 +533,9 @@ class TraeClient:
             logger.info(f"Solo API 响应: {result}")
             
             data = result.get('Result', result)
-            return SoloQualification.from_dict(data)
+            qualification = SoloQualification.from_dict(data)
+            self._cache_put("solo_qualification", qualification, _SOLO_QUALIFICATION_TTL)
+            return qualification
         except Exception as e:
             logger.error(f"获取 Solo 资格失败: {e}")
             return None
@@ -530,6 +641,7 @@ class TraeClient:
         if self.ipc:
             self.ipc.disconnect()
             self.ipc = None
+        self.transport.close()
 
 
 class _RESTTransport:
@@ -540,30 +652,124 @@ class _RESTTransport:
         self.session = requests.Session()
         self.session.headers.update({
             "Content-Type": "application/json",
-            "User-Agent": "Trae-CN/3.3.11"
+            "User-Agent": "Trae-CN/3.3.11",
+            "Connection": "keep-alive"
         })
+
+        # 复用 TCP/TLS 连接，并由 urllib3 负责幂等请求的重试
+        adapter = HTTPAdapter(
+            pool_connections=_POOL_CONNECTIONS,
+            pool_maxsize=_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=config.max_retries,
+                backoff_factor=_RETRY_BACKOFF,
+                status_forcelist=_RETRY_STATUS,
+                allowed_methods=_RETRY_METHODS,
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # 已写入 session.headers 的 Token，config.token 变化时重建认证头
+        self._headers_token: Optional[str] = None
+        # Token 过期时间（JWT 的 exp，epoch 秒），直接与 time.time() 比较
+        self._token_expires_at: Optional[float] = None
+
+        # 完整 URL 缓存：接口路径 -> URL，base_url 变化时清空
+        self._url_base: Optional[str] = None
+        self._urls: Dict[str, str] = {}
     
     def get_headers(self) -> dict:
-        """获取请求头"""
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Trae-CN/3.3.11"
-        }
-        if self.config.token:
-            headers["Authorization"] = f"Bearer {self.config.token}"
-            headers["x-cloudide-token"] = self.config.token
-        return headers
+        """
+        获取实际发送的请求头
+
+        静态请求头和认证头都在 session.headers 中；认证头只在 Token 变化时重建
+
+        Returns:
+            dict: session 的完整请求头（含认证头，未设置 Token 时不含）
+        """
+        self._sync_token()
+        return dict(self.session.headers)
+
+    def _sync_token(self):
+        """config.token 变化时重建认证请求头、写入 session 并重新解析过期时间"""
+        token = self.config.token
+        if token != self._headers_token:
+            self._headers_token = token
+            for name in _NO_AUTH_HEADERS:
+                self.session.headers.pop(name, None)
+            if token:
+                self.session.headers.update({
+                    "Authorization": f"Bearer {token}",
+                    "x-cloudide-token": token
+                })
+            self._token_expires_at = _jwt_exp(token) if token else None
+
+    def _token_expired(self) -> bool:
+        """按最近一次同步的过期时间判断 Token 是否已过期，不重新同步"""
+        expires_at = self._token_expires_at
+        return expires_at is not None and expires_at <= time.time()
+
+    def _url(self, endpoint: str) -> str:
+        """拼接并缓存接口的完整 URL"""
+        base_url = self.config.base_url
+        if base_url != self._url_base:
+            self._url_base = base_url
+            self._urls.clear()
+
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = base_url + endpoint
+        return url
+
+    def is_token_valid(self) -> bool:
+        """
+        检查 Token 是否有效
+
+        只在本地解析 JWT 的 exp，不请求服务器；无法解析过期时间的 Token 视为有效
+
+        Returns:
+            bool: 是否设置了 Token 且未过期
+        """
+        self._sync_token()
+        return bool(self._headers_token) and not self._token_expired()
     
     def execute_request(
         self,
         method: str,
         endpoint: str,
         params: dict = None,
-        data: dict = None
+        data: dict = None,
+        authenticated: bool = True
     ) -> dict:
-        """执行 REST 请求"""
-        url = f"{self.config.base_url}{endpoint}"
-        headers = self.get_headers()
+        """
+        执行 REST 请求
+
+        Args:
+            method: HTTP 方法
+            endpoint: 接口路径
+            params: 查询参数
+            data: JSON 请求体
+            authenticated: 是否携带 Token；为 True 且 Token 已过期时不发请求直接报错
+
+        Returns:
+            dict: 响应数据
+
+        Raises:
+            TraeAPIError: Token 已过期
+        """
+        url = self._url(endpoint)
+
+        if authenticated:
+            # 认证头由 _sync_token 写入 session.headers，无需逐次传入
+            self._sync_token()
+            # 本地即可判断的过期 Token 必然被服务器拒绝，省去一次往返
+            if self._token_expired():
+                raise TraeAPIError("Token 已过期，请重新登录")
+            headers = None
+        else:
+            headers = _NO_AUTH_HEADERS
         
         logger.info(f"[REST] {method} {endpoint}")
         
@@ -582,7 +788,7 @@ class _RESTTransport:
                 raise ValueError(f"不支持的方法: {method}")
             
             response.raise_for_status()
-            return response.json()
+            return _decode_json(response)
             
         except requests.exceptions.HTTPError as e:
             logger.error(f"HTTP 错误: {e}")
@@ -591,6 +797,10 @@ class _RESTTransport:
             logger.error(f"请求失败: {e}")
             raise
 
+    def close(self):
+        """关闭 HTTP 会话"""
+        self.session.close()
+
 
 def create_client(token: str = None, use_ipc: bool = False) -> TraeClient:
     """